@@ -1,26 +1,40 @@
-"""Analyze cProfile output to identify performance bottlenecks."""
+"""Analyze cProfile output to identify performance bottlenecks.
 
+Reads profile.stats written by ``python -m cProfile -o profile.stats
+profile_batch_calc.py``. For a sampling flamegraph that also covers native
+(LuaJIT) time, see the py-spy/scalene commands in profile_batch_calc.py.
+"""
+
+import heapq
 import pstats
-from pstats import SortKey
 
-# Load profile stats
+# Load profile stats once; every view below selects from the same raw table.
 stats = pstats.Stats('profile.stats')
 
-# Sort by cumulative time and show top 30 functions
-print("=" * 80)
-print("TOP 30 FUNCTIONS BY CUMULATIVE TIME")
-print("=" * 80)
-stats.sort_stats(SortKey.CUMULATIVE)
-stats.print_stats(30)
-
-print("\n" + "=" * 80)
-print("TOP 30 FUNCTIONS BY TOTAL TIME (self time)")
-print("=" * 80)
-stats.sort_stats(SortKey.TIME)
-stats.print_stats(30)
-
-print("\n" + "=" * 80)
-print("TOP 20 FUNCTIONS BY CALL COUNT")
-print("=" * 80)
-stats.sort_stats(SortKey.CALLS)
-stats.print_stats(20)
+# Each entry: func -> (primitive calls, total calls, tottime, cumtime, callers)
+ROWS = [(func, cc, nc, tt, ct) for func, (cc, nc, tt, ct, _callers) in stats.stats.items()]
+
+
+def print_top(title: str, key_index: int, limit: int) -> None:
+    """Print the ``limit`` largest rows by one column, pstats-style.
+
+    heapq.nlargest keeps only the top-K rows (O(N log K)) instead of re-sorting
+    the whole profile for every view the way sort_stats() + print_stats() does.
+    """
+    print("=" * 80)
+    print(title)
+    print("=" * 80)
+    print(f"{'ncalls':>12} {'tottime':>9} {'percall':>9} {'cumtime':>9} {'percall':>9} filename:lineno(function)")
+    for func, cc, nc, tt, ct in heapq.nlargest(limit, ROWS, key=lambda row: row[key_index]):
+        ncalls = str(nc) if nc == cc else f"{nc}/{cc}"
+        tt_per = tt / nc if nc else 0.0
+        ct_per = ct / cc if cc else 0.0
+        print(f"{ncalls:>12} {tt:9.3f} {tt_per:9.3f} {ct:9.3f} {ct_per:9.3f} {pstats.func_std_string(func)}")
+
+
+# Row columns: 0=func, 1=primitive calls, 2=total calls, 3=tottime, 4=cumtime
+print_top("TOP 30 FUNCTIONS BY CUMULATIVE TIME", 4, 30)
+print()
+print_top("TOP 30 FUNCTIONS BY TOTAL TIME (self time)", 3, 30)
+print()
+print_top("TOP 20 FUNCTIONS BY CALL COUNT", 2, 20)
@@ -1,16 +1,13 @@
 """Debug what properties are available on grantedEffect for skill processing."""
 
-import lupa
-
-# Initialize Lua to access PoB data
-lua = lupa.LuaRuntime(unpack_returned_tuples=True)
-
-# Load MinimalCalc to get access to data.skills
-with open("src/calculator/MinimalCalc.lua", "r", encoding="utf-8") as f:
-    lua_code = f.read()
-
-# Execute MinimalCalc bootstrap
-lua.execute(lua_code)
+from src.calculator.build_calculator import get_pob_engine
+
+# Reuse the thread-local engine's LuaRuntime: it already has the stub
+# functions, package.path and MinimalCalc bootstrap (data.skills) loaded, and
+# repeated lookups in the same process share it instead of re-bootstrapping.
+engine = get_pob_engine()
+engine._ensure_initialized()
+lua = engine._lua
 
 # Get the Lightning Arrow skill data
 lua_code_check = """
@@ -18,29 +18,31 @@ pob_section = pob_data.get("PathOfBuilding2", {})
 skills = _extract_skills(pob_section)
 
 print(f"Extracted {len(skills)} skills:\n")
+
+# Single pass: print each skill and collect potential issues as we go
+issues = []
 for i, skill in enumerate(skills, 1):
+    name = skill.name
+    supports = skill.support_gems
     print(f"Skill {i}:")
-    print(f"  name: {skill.name}")
+    print(f"  name: {name}")
     print(f"  skill_id: {skill.skill_id}")
     print(f"  level: {skill.level}")
     print(f"  quality: {skill.quality}")
     print(f"  enabled: {skill.enabled}")
-    print(f"  support_gems: {len(skill.support_gems)} supports")
-    if skill.support_gems:
-        for j, support in enumerate(skill.support_gems, 1):
-            print(f"    Support {j}: {support}")
+    print(f"  support_gems: {len(supports)} supports")
+    if not skill.skill_id:
+        issues.append(f"⚠️ Skill {i} ({name}) has no skill_id")
+    if not skill.enabled:
+        issues.append(f"⚠️ Skill {i} ({name}) is disabled")
+    for j, support in enumerate(supports, 1):
+        print(f"    Support {j}: {support}")
+        if not isinstance(support, dict):
+            issues.append(f"⚠️ Skill {i} support {j} is not a dict: {type(support)}")
+        elif 'skillId' not in support:
+            issues.append(f"⚠️ Skill {i} support {j} missing skillId: {support}")
     print()
 
-# Check for potential issues
 print("\n=== POTENTIAL ISSUES ===")
-for i, skill in enumerate(skills, 1):
-    if not skill.skill_id:
-        print(f"⚠️ Skill {i} ({skill.name}) has no skill_id")
-    if not skill.enabled:
-        print(f"⚠️ Skill {i} ({skill.name}) is disabled")
-    if skill.support_gems:
-        for j, support in enumerate(skill.support_gems, 1):
-            if not isinstance(support, dict):
-                print(f"⚠️ Skill {i} support {j} is not a dict: {type(support)}")
-            elif 'skillId' not in support:
-                print(f"⚠️ Skill {i} support {j} missing skillId: {support}")
+for issue in issues:
+    print(issue)
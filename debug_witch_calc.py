@@ -31,14 +31,8 @@ try:
 
     # Print all available stats for debugging
     print(f"\n=== ALL AVAILABLE STATS ===")
-    for attr in dir(stats):
-        if not attr.startswith('_'):
-            try:
-                val = getattr(stats, attr)
-                if not callable(val):
-                    print(f"{attr}: {val}")
-            except:
-                pass
+    for attr, val in stats.to_dict().items():
+        print(f"{attr}: {val}")
 
     print(f"\n=== EXPECTED (PoB GUI) ===")
     print(f"Life: 65")
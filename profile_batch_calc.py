@@ -8,6 +8,14 @@ Usage:
 Then in pstats:
     sort cumtime
     stats 20
+
+Or summarize with: python analyze_profile.py
+
+cProfile hooks every Python call, so its overhead inflates call-heavy code and
+time spent inside lupa/LuaJIT shows up only as opaque builtin frames. For a
+low-overhead view that attributes native time, use a sampling profiler instead:
+    py-spy record --native -o profile.svg -- python profile_batch_calc.py
+    scalene profile_batch_calc.py
 """
 
 from src.models.build_data import BuildData, CharacterClass
@@ -2,19 +2,88 @@
 Flask + SSE Prototype
 Demonstrates Server-Sent Events for real-time progress streaming.
 De-risks Story 3.5 (highest technical complexity in Epic 3).
+
+Run with ``python app.py`` (threaded dev server, one OS thread per open
+stream) or ``gunicorn -k gevent -w 1 -t 0 app:app`` to multiplex many
+streams on one event loop; see README.md.
 """
 from flask import Flask, render_template, Response, jsonify
-import time
 import threading
-import queue
+import time
 import json
+from collections import deque
 from datetime import datetime
 
 app = Flask(__name__)
 
 # Simulated optimization sessions
 sessions = {}
-sse_queues = {}
+sse_channels = {}
+
+# Terminal events end the stream and are never coalesced.
+TERMINAL_EVENTS = ('complete', 'error', 'cancelled')
+
+# Pre-encoded SSE framing: one bytes chunk per event, no per-event f-strings
+# and no str -> bytes re-encoding by the response.
+EVENT_PREFIXES = {
+    event_type: f'event: {event_type}\ndata: '.encode()
+    for event_type in ('progress', 'complete', 'error', 'cancelled')
+}
+KEEPALIVE = b': keepalive\n\n'
+
+
+class ProgressChannel:
+    """Per-session event channel that coalesces progress updates.
+
+    Progress events overwrite a single latest-wins slot and are flushed to the
+    stream at most once per ``min_interval`` seconds, so a producer emitting
+    per-iteration progress cannot flood the client. Terminal events go through
+    a FIFO, are never dropped, and flush any pending progress ahead of them.
+    """
+
+    def __init__(self, min_interval=0.25):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._latest_progress = None
+        self._terminal = deque()
+        self._last_flush = 0.0
+
+    def put(self, event_type, data):
+        """Publish an event (never blocks, never drops terminal events)."""
+        msg = {'event': event_type, 'data': data}
+        with self._lock:
+            if event_type in TERMINAL_EVENTS:
+                self._terminal.append(msg)
+            else:
+                self._latest_progress = msg
+        self._wake.set()
+
+    def drain(self, timeout):
+        """Return the messages due for flushing, or [] after ``timeout`` seconds."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                out = []
+                if self._latest_progress is not None and (
+                    self._terminal or now - self._last_flush >= self.min_interval
+                ):
+                    out.append(self._latest_progress)
+                    self._latest_progress = None
+                    self._last_flush = now
+                out.extend(self._terminal)
+                self._terminal.clear()
+                if out:
+                    return out
+                self._wake.clear()
+                wait_for = deadline - now
+                if self._latest_progress is not None:
+                    # Throttled progress pending: wake when its interval elapses.
+                    wait_for = min(wait_for, self.min_interval - (now - self._last_flush))
+            if wait_for <= 0:
+                return []
+            self._wake.wait(wait_for)
 
 
 class SimulatedOptimization:
@@ -23,18 +92,21 @@ class SimulatedOptimization:
     def __init__(self, session_id):
         self.session_id = session_id
         self.max_iterations = 600
-        self.running = True
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Request cancellation; wakes the running loop immediately."""
+        self._cancel.set()
 
     def run(self):
         """Simulate optimization progress with updates every 100ms."""
         for iteration in range(1, self.max_iterations + 1):
-            if not self.running:
+            # Simulate some work (100ms per iteration). Waiting on the cancel
+            # event instead of sleeping returns as soon as cancel() is called.
+            if self._cancel.wait(timeout=0.1):
                 self._send_event('cancelled', {'message': 'Optimization cancelled'})
                 break
 
-            # Simulate some work
-            time.sleep(0.1)  # 100ms per iteration
-
             # Send progress update every 100 iterations
             if iteration % 100 == 0 or iteration == 1:
                 improvement_pct = (iteration / self.max_iterations) * 15.0  # Simulate up to 15% improvement
@@ -56,7 +128,7 @@ class SimulatedOptimization:
                 })
 
         # Send completion event
-        if self.running:
+        if not self._cancel.is_set():
             self._send_event('complete', {
                 'final_iteration': self.max_iterations,
                 'improvement_pct': 15.2,
@@ -65,15 +137,10 @@ class SimulatedOptimization:
             })
 
     def _send_event(self, event_type, data):
-        """Send SSE event to the queue."""
-        if self.session_id in sse_queues:
-            try:
-                sse_queues[self.session_id].put_nowait({
-                    'event': event_type,
-                    'data': data
-                })
-            except queue.Full:
-                pass  # Drop message if queue full
+        """Send SSE event to the session's channel."""
+        channel = sse_channels.get(self.session_id)
+        if channel is not None:
+            channel.put(event_type, data)
 
 
 @app.route('/')
@@ -87,8 +154,8 @@ def start_optimization():
     """Start a simulated optimization."""
     session_id = f"session-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
 
-    # Create SSE queue for this session
-    sse_queues[session_id] = queue.Queue(maxsize=100)
+    # Create SSE channel for this session
+    sse_channels[session_id] = ProgressChannel()
 
     # Create and start optimization thread
     optimization = SimulatedOptimization(session_id)
@@ -107,39 +174,38 @@ def start_optimization():
 def progress_stream(session_id):
     """SSE endpoint for streaming optimization progress."""
 
-    # Create queue if it doesn't exist
-    if session_id not in sse_queues:
-        sse_queues[session_id] = queue.Queue(maxsize=100)
+    # Create channel if it doesn't exist
+    if session_id not in sse_channels:
+        sse_channels[session_id] = ProgressChannel()
 
-    q = sse_queues[session_id]
+    channel = sse_channels[session_id]
 
     def event_stream():
         """Generator yielding SSE-formatted messages."""
         try:
             while True:
-                try:
-                    # Block until message available (1 second timeout)
-                    msg = q.get(timeout=1.0)
-                except queue.Empty:
+                # Block until messages are due (1 second timeout)
+                messages = channel.drain(timeout=1.0)
+                if not messages:
                     # Send keepalive comment (prevent connection timeout)
-                    yield ': keepalive\n\n'
+                    yield KEEPALIVE
                     continue
 
-                # Format as SSE message
-                event_type = msg['event']
-                data = json.dumps(msg['data'])
+                for msg in messages:
+                    # Format as SSE message
+                    event_type = msg['event']
+                    data = json.dumps(msg['data'], separators=(',', ':')).encode()
 
-                yield f'event: {event_type}\n'
-                yield f'data: {data}\n\n'
+                    yield EVENT_PREFIXES[event_type] + data + b'\n\n'
 
-                # Close stream after 'complete', 'error', or 'cancelled'
-                if event_type in ('complete', 'error', 'cancelled'):
-                    break
+                    # Close stream after 'complete', 'error', or 'cancelled'
+                    if event_type in TERMINAL_EVENTS:
+                        return
 
         finally:
-            # Cleanup: Remove queue
-            if session_id in sse_queues:
-                del sse_queues[session_id]
+            # Cleanup: Remove channel
+            if session_id in sse_channels:
+                del sse_channels[session_id]
 
     # Return SSE response
     return Response(
@@ -157,7 +223,7 @@ def progress_stream(session_id):
 def cancel_optimization(session_id):
     """Cancel a running optimization."""
     if session_id in sessions:
-        sessions[session_id].running = False
+        sessions[session_id].cancel()
         return jsonify({'status': 'cancelled'})
     return jsonify({'error': 'Session not found'}), 404
 
@@ -1,17 +1,10 @@
-"""Quick script to run Story 1.5 tests and capture results."""
-import subprocess
-import sys
+"""Quick script to run Story 1.5 tests and capture results.
 
-result = subprocess.run(
-    [sys.executable, "-m", "pytest", "tests/integration/test_single_calculation.py", "-v", "--tb=no"],
-    capture_output=True,
-    text=True,
-    timeout=60
-)
+Runs pytest in-process (pytest.main); ``-q -rA`` reduces the output to the
+per-test PASSED/FAILED summary lines and the final counts.
+"""
+import sys
 
-# Print only lines with test results
-for line in result.stdout.split('\n'):
-    if 'PASSED' in line or 'FAILED' in line or 'passed' in line or 'failed' in line or '====' in line:
-        print(line)
+import pytest
 
-sys.exit(result.returncode)
+sys.exit(pytest.main(["tests/integration/test_single_calculation.py", "-q", "--tb=no", "-rA"]))
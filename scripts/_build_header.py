@@ -0,0 +1,107 @@
+"""Read only the <Build> and <Tree><Spec> attributes of a PoB build XML.
+
+generate_corpus_manifest.py and generate_baseline_stats.py need nothing but
+the character/level/version attributes and the allocated ``nodes`` string.
+Those sit at the top of the file (Build, Import, Party, Tree, ...), ahead of
+the bulky Skills/Items/Config sections, so an expat pass that only handles
+start tags and stops at the first top-level element after <Tree> avoids
+parsing - or building dicts for - the rest of the document.
+
+Not a module to run directly; scripts import it as a sibling
+(``from _build_header import read_build_header``) since scripts/ is not a
+package.
+"""
+
+import xml.parsers.expat
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+ROOT_TAGS = ("PathOfBuilding2", "PathOfBuilding")
+
+
+class _HeaderRead(Exception):
+    """Raised from the expat handler to stop once <Tree> has been read."""
+
+
+def read_build_header(
+    xml_path: Path
+) -> Tuple[Optional[Dict[str, str]], Optional[Dict[str, str]]]:
+    """Return the attributes of <Build> and of the tree's <Spec>.
+
+    Args:
+        xml_path: Path to PoB XML file
+
+    Returns:
+        Same as parse_build_header()
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: Same as parse_build_header()
+    """
+    with open(xml_path, "rb") as f:
+        return _read_header(lambda parser: parser.ParseFile(f))
+
+
+def parse_build_header(
+    xml_data: Union[str, bytes]
+) -> Tuple[Optional[Dict[str, str]], Optional[Dict[str, str]]]:
+    """Like read_build_header(), for a document already in memory.
+
+    Args:
+        xml_data: PoB XML document
+
+    Returns:
+        (build_attrs, spec_attrs): build_attrs is None if the document has no
+        <Build> section; spec_attrs is {} if there is no <Spec>, and None if
+        <Tree> holds more than one (callers decide how to treat multi-Spec
+        builds, as the dict-based loaders did)
+
+    Raises:
+        ValueError: If the root is not <PathOfBuilding> / <PathOfBuilding2>,
+            or the XML before </Tree> is malformed (ExpatError)
+    """
+    return _read_header(lambda parser: parser.Parse(xml_data, True))
+
+
+def _read_header(
+    feed: Callable[[Any], Any]
+) -> Tuple[Optional[Dict[str, str]], Optional[Dict[str, str]]]:
+    """Run ``feed(parser)`` with the header-collecting handlers installed."""
+    build_attrs: Optional[Dict[str, str]] = None
+    specs = []
+    depth = 0
+    in_tree = False
+
+    def start(tag, attrs):
+        nonlocal build_attrs, depth, in_tree
+        depth += 1
+        if depth == 1:
+            if tag not in ROOT_TAGS:
+                raise ValueError("Missing PathOfBuilding or PathOfBuilding2 root element")
+        elif depth == 2:
+            if in_tree:
+                raise _HeaderRead
+            if tag == "Build":
+                build_attrs = attrs
+            elif tag == "Tree":
+                in_tree = True
+        elif depth == 3 and in_tree and tag == "Spec":
+            specs.append(attrs)
+
+    def end(tag):
+        nonlocal depth
+        depth -= 1
+
+    parser = xml.parsers.expat.ParserCreate()
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    try:
+        feed(parser)
+    except _HeaderRead:
+        pass
+    except xml.parsers.expat.ExpatError as e:
+        raise ValueError(f"Unable to parse XML structure: {e}") from e
+
+    if len(specs) > 1:
+        return build_attrs, None
+    return build_attrs, specs[0] if specs else {}
@@ -0,0 +1,124 @@
+"""Helpers shared by the generate_degraded_builds*.py scripts.
+
+Not a module to run directly; scripts import it as a sibling
+(``from _degrade_common import load_build_from_xml_file``) since scripts/ is
+not a package.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet, Optional, Tuple
+
+from src.models.build_data import BuildData, CharacterClass
+from src.parsers.pob_parser import parse_node_ids
+
+from _build_header import parse_build_header
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+# nodes="..." on a <Spec> start tag (PoB always writes double-quoted attributes)
+_SPEC_NODES_RE = re.compile(r'(<Spec\b[^>]*?\snodes=")[^"]*(")')
+
+
+def load_build_from_xml_file(xml_path: Path) -> Tuple[BuildData, str]:
+    """Load BuildData and raw XML from file.
+
+    The parse is memoized per (path, mtime_ns, size), so running several
+    degradation strategies in one process parses each source build once.
+    Every call still returns a fresh BuildData (own passive_nodes set).
+
+    Args:
+        xml_path: Path to PoB XML file
+
+    Returns:
+        Tuple of (BuildData, raw_xml_string)
+    """
+    if not xml_path.exists():
+        raise FileNotFoundError(f"Build file not found: {xml_path}")
+
+    st = xml_path.stat()
+    (character_class, level, ascendancy, passive_nodes), xml_str = _read_build(
+        str(xml_path.resolve()), st.st_mtime_ns, st.st_size
+    )
+
+    build_data = BuildData(
+        character_class=character_class,
+        level=level,
+        ascendancy=ascendancy,
+        passive_nodes=set(passive_nodes),
+        items=[],
+        skills=[],
+        tree_version="0_1"
+    )
+
+    return build_data, xml_str
+
+
+@lru_cache(maxsize=None)
+def _read_build(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[CharacterClass, int, Optional[str], FrozenSet[int]], str]:
+    """Read and parse one build; the stat fields only serve as cache key."""
+    # Read raw XML
+    xml_str = Path(path).read_text(encoding='utf-8')
+
+    # Only the <Build> and <Tree><Spec> attributes are needed; stop parsing
+    # there instead of building the whole document (the degraded XML is
+    # produced from xml_str by set_spec_nodes, not from a parsed tree)
+    build_section, spec = parse_build_header(xml_str)
+    if build_section is None:
+        raise ValueError("Missing Build section")
+
+    # Extract character data
+    class_name = build_section.get("className")
+    character_class = CharacterClass(class_name) if class_name else CharacterClass.WITCH
+
+    level = int(build_section.get("level", "90"))
+
+    ascendancy = build_section.get("ascendClassName")
+    if ascendancy == "None":
+        ascendancy = None
+
+    # Extract passive tree
+    nodes_str = spec.get("nodes", "")
+
+    try:
+        passive_nodes = frozenset(parse_node_ids(nodes_str))
+    except ValueError:
+        passive_nodes = frozenset()
+
+    return (character_class, level, ascendancy, passive_nodes), xml_str
+
+
+def set_spec_nodes(xml_str: str, nodes_str: str) -> str:
+    """Return ``xml_str`` with every <Tree><Spec> ``nodes`` attribute replaced.
+
+    Degrading a build only rewrites this one attribute, so it is substituted
+    in the raw text instead of parsing and re-serializing the whole document
+    (which also keeps the source formatting intact). Falls back to
+    ElementTree when no ``nodes="..."`` attribute matches, e.g. a Spec
+    without one.
+
+    Args:
+        xml_str: PoB XML document
+        nodes_str: New comma-separated node IDs
+
+    Returns:
+        Modified XML string, always starting with an XML declaration
+    """
+    modified_xml, count = _SPEC_NODES_RE.subn(
+        lambda m: m.group(1) + nodes_str + m.group(2), xml_str
+    )
+
+    if count == 0:
+        root = ET.fromstring(xml_str)
+        for tree_elem in root.findall(".//Tree/Spec"):
+            tree_elem.set("nodes", nodes_str)
+        modified_xml = ET.tostring(root, encoding='unicode')
+
+    if not modified_xml.startswith('<?xml'):
+        modified_xml = XML_DECLARATION + modified_xml
+
+    return modified_xml
@@ -0,0 +1,42 @@
+"""JSON read/write helpers shared by the corpus and validation scripts.
+
+orjson parses/serializes in C and is used when installed; the stdlib json
+fallback is configured to produce the same text (UTF-8, non-ASCII kept
+as-is, 2-space indent), so output does not depend on which one ran.
+
+Not a module to run directly; scripts import it as a sibling
+(``from _json_io import write_json``) since scripts/ is not a package.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+# Optional: orjson parses/serializes in C; stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize ``data`` as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write ``data`` to ``path`` as 2-space-indented UTF-8 JSON."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,65 @@
+"""On-disk cache of parse_xml() results for build XML files.
+
+Corpus scripts (demo_optimization.py, analyze_gap_results.py) re-parse the
+same build XMLs on every run even though the files rarely change. The parsed
+dict is pickled under ``.cache/xml_parse/`` keyed by the file's absolute path
+and validated against its (mtime_ns, size), so an edited file is re-parsed
+on the next read.
+
+Not a module to run directly; scripts import it as a sibling
+(``from _xml_cache import parse_xml_file``) since scripts/ is not a package.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+
+from src.parsers.xml_utils import parse_xml
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "xml_parse"
+
+
+def _cache_path(xml_path: Path, cache_dir: Path) -> Path:
+    key = hashlib.sha1(str(xml_path).encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.pkl"
+
+
+def parse_xml_file(xml_path: Path, cache_dir: Path = CACHE_DIR) -> dict:
+    """Return ``parse_xml(xml_path.read_text())``, cached on disk.
+
+    A cache entry is used only when the stored (mtime_ns, size) still match
+    the file; unreadable or stale entries are silently rebuilt.
+
+    Raises:
+        OSError: If the XML file cannot be read
+        InvalidFormatError: If the XML is malformed (never cached)
+    """
+    xml_path = Path(xml_path).resolve()
+    st = xml_path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_file = _cache_path(xml_path, cache_dir)
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    data = parse_xml(xml_path.read_text(encoding="utf-8"))
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(
+            f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp_file, "wb") as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # cache is best-effort; the parse result is still correct
+
+    return data
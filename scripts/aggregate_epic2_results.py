@@ -10,41 +10,87 @@ Task 6 Success Criteria:
 - Zero budget violations
 
 Usage:
-    python scripts/aggregate_epic2_results.py <results_dir>
+    python scripts/aggregate_epic2_results.py <results_dir> [--pretty]
 
 Author: Amelia (Dev Agent)
 Date: 2025-11-26
 """
 
-import json
+import argparse
+import functools
+import io
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from statistics import median, mean
-from typing import List, Dict, Any
+from statistics import fmean, median
+from typing import List, Dict, Any, Optional
+
+from _json_io import json_dumps, json_loads, write_json
+
+
+def _write_report(path: Path, header: Dict[str, Any], summary: Dict[str, Any],
+                  results: List[Dict[str, Any]], pretty: bool = False) -> None:
+    """Write ``{**header, "summary": ..., "results": [...]}`` to ``path``.
+
+    The default compact form is streamed: the header and summary are written
+    first, then each result is serialized and written on its own, so the whole
+    report never exists as one combined dict or one big string. ``pretty``
+    keeps the previous indent=2 layout.
+    """
+    if pretty:
+        write_json(path, {**header, "summary": summary, "results": results})
+        return
+
+    with open(path, 'wb') as f:
+        f.write(json_dumps(header)[:-1])  # reopen the header object: drop its '}'
+        f.write(b',"summary":')
+        f.write(json_dumps(summary))
+        f.write(b',"results":[')
+        for i, result in enumerate(results):
+            if i:
+                f.write(b',')
+            f.write(json_dumps(result))
+        f.write(b']}')
+
+
+def _load_one(json_file: str) -> Optional[Dict[str, Any]]:
+    """Load one result file; None (with a warning) if it can't be read."""
+    try:
+        with open(json_file, 'rb') as f:
+            return json_loads(f.read())
+    except Exception as e:
+        print(f"WARNING: Failed to load {json_file}: {e}")
+        return None
 
 
 def load_results(results_dir: Path) -> List[Dict[str, Any]]:
-    """Load all individual result JSON files."""
+    """Load all individual result JSON files.
+
+    Files are read on a small thread pool so the per-file open/read latency
+    overlaps (hundreds of xdist shards, possibly on a network filesystem).
+    Results keep the directory listing order.
+    """
     results = []
 
     if not results_dir.exists():
         print(f"ERROR: Results directory not found: {results_dir}")
         return results
 
-    json_files = list(results_dir.glob("*.json"))
+    # Flat directory: scandir + endswith avoids glob's per-entry Path/fnmatch work
+    with os.scandir(results_dir) as entries:
+        json_files = [
+            entry.path for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
 
     if not json_files:
         print(f"WARNING: No result files found in {results_dir}")
         return results
 
-    for json_file in json_files:
-        try:
-            with open(json_file, 'r') as f:
-                result = json.load(f)
-                results.append(result)
-        except Exception as e:
-            print(f"WARNING: Failed to load {json_file}: {e}")
+    with ThreadPoolExecutor(max_workers=min(16, len(json_files))) as executor:
+        results = [r for r in executor.map(_load_one, json_files) if r is not None]
 
     return results
 
@@ -82,8 +128,46 @@ def analyze_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     # DPS) and DEGENERATE (baseline_dps ~ 0 because the engine can't yet compute
     # minion/warcry/non-damaging-main DPS). Degenerate builds are reported N/A, not
     # 0%, so they don't drag the optimizer metric down. See MEASURABLE_DPS_THRESHOLD.
-    measurable = [r for r in successful if r.get("baseline_dps", 0) >= MEASURABLE_DPS_THRESHOLD]
-    degenerate = [r for r in successful if r.get("baseline_dps", 0) < MEASURABLE_DPS_THRESHOLD]
+    #
+    # One pass over the successful builds does the split AND accumulates every
+    # statistic below, instead of re-walking the list once per metric.
+    measurable = []
+    degenerate = []
+    improvements = []
+    nodes_added = []
+    times = []
+    budget_violations = 0
+    dps_improved = life_improved = mana_improved = 0
+    total_dps_gain = total_life_gain = total_mana_gain = 0
+
+    for r in successful:
+        # Time / budget statistics span ALL successful builds: degenerate builds were
+        # still optimized, so their completion time and budget use are valid signals.
+        times.append(r["time_seconds"])
+        if r["unallocated_used"] > 20:
+            budget_violations += 1
+
+        baseline_dps = r.get("baseline_dps", 0)
+        if baseline_dps < MEASURABLE_DPS_THRESHOLD:
+            degenerate.append(r)
+            continue
+        measurable.append(r)
+
+        # Headline DPS / node / gain metrics are computed over MEASURABLE builds only.
+        improvement = r["improvement_pct"]
+        life_change = r["life_change"]
+        mana_change = r["mana_change"]
+        improvements.append(improvement)
+        nodes_added.append(r["nodes_added"])
+        if improvement > 0:
+            dps_improved += 1
+        if life_change > 0:
+            life_improved += 1
+        if mana_change > 0:
+            mana_improved += 1
+        total_dps_gain += r["optimized_dps"] - baseline_dps
+        total_life_gain += life_change
+        total_mana_gain += mana_change
 
     # Calculate statistics for successful builds
     summary = {
@@ -119,37 +203,18 @@ def analyze_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not measurable:
         return summary
 
-    # Headline DPS metrics are computed over MEASURABLE builds only.
-    improvements = [r["improvement_pct"] for r in measurable]
-    dps_improvements = [r for r in measurable if r["improvement_pct"] > 0]
-    life_improvements = [r for r in measurable if r["life_change"] > 0]
-    mana_improvements = [r for r in measurable if r["mana_change"] > 0]
-
-    # Time / budget statistics span ALL successful builds: degenerate builds were
-    # still optimized, so their completion time and budget use are valid signals.
-    times = [r["time_seconds"] for r in successful]
-    budget_violations = len([r for r in successful if r["unallocated_used"] > 20])
-
-    # Node statistics (measurable builds)
-    nodes_added = [r["nodes_added"] for r in measurable]
-
-    # DPS/Life/Mana gains (measurable builds)
-    total_dps_gain = sum(r["optimized_dps"] - r["baseline_dps"] for r in measurable)
-    total_life_gain = sum(r["life_change"] for r in measurable)
-    total_mana_gain = sum(r["mana_change"] for r in measurable)
-
     # Populate summary (median/mean/success-rate over MEASURABLE builds)
-    summary["success_rate_pct"] = (len(dps_improvements) / len(measurable) * 100) if measurable else 0
+    summary["success_rate_pct"] = (dps_improved / len(measurable) * 100) if measurable else 0
     summary["median_improvement_pct"] = median(improvements) if improvements else 0
-    summary["mean_improvement_pct"] = mean(improvements) if improvements else 0
+    summary["mean_improvement_pct"] = fmean(improvements) if improvements else 0
     summary["max_time_seconds"] = max(times) if times else 0
-    summary["mean_time_seconds"] = mean(times) if times else 0
+    summary["mean_time_seconds"] = fmean(times) if times else 0
     summary["budget_violations"] = budget_violations
     summary["total_nodes_allocated"] = sum(nodes_added)
     summary["median_nodes_added"] = median(nodes_added) if nodes_added else 0
-    summary["builds_with_dps_improvement"] = len(dps_improvements)
-    summary["builds_with_life_improvement"] = len(life_improvements)
-    summary["builds_with_mana_improvement"] = len(mana_improvements)
+    summary["builds_with_dps_improvement"] = dps_improved
+    summary["builds_with_life_improvement"] = life_improved
+    summary["builds_with_mana_improvement"] = mana_improved
     summary["total_dps_gain"] = total_dps_gain
     summary["total_life_gain"] = total_life_gain
     summary["total_mana_gain"] = total_mana_gain
@@ -165,87 +230,101 @@ def analyze_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         "median_improvement_5": median_improvement_5,
         "all_under_5min": all_under_5min,
         "zero_budget_violations": zero_budget_violations,
-        "overall_pass": all([success_rate_70, median_improvement_5, all_under_5min, zero_budget_violations])
+        "overall_pass": success_rate_70 and median_improvement_5 and all_under_5min and zero_budget_violations
     }
 
     return summary
 
 
 def print_report(summary: Dict[str, Any], results: List[Dict[str, Any]]):
-    """Print validation report to console."""
-    print("\n" + "="*60)
-    print("EPIC 2 VALIDATION REPORT")
-    print("="*60)
-    print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Corpus: tests/fixtures/realistic_builds/")
-    print(f"Optimization Budget: 20 points per build")
-
-    print("\n" + "="*60)
-    print("RESULTS SUMMARY")
-    print("="*60)
-    print(f"Total Builds: {summary['total_builds']}")
-    print(f"Successful: {summary['successful']}")
-    print(f"Errors: {summary['errors']}")
-    print(f"Measurable (real baseline DPS): {summary.get('measurable', summary['successful'])}")
+    """Print validation report to console.
+
+    Lines are collected in a buffer and written with a single stdout write
+    (one lock/syscall instead of one per line under xdist/CI log capture).
+    """
+    buf = io.StringIO()
+    out = functools.partial(print, file=buf)
+
+    out("\n" + "="*60)
+    out("EPIC 2 VALIDATION REPORT")
+    out("="*60)
+    out(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    out(f"Corpus: tests/fixtures/realistic_builds/")
+    out(f"Optimization Budget: 20 points per build")
+
+    out("\n" + "="*60)
+    out("RESULTS SUMMARY")
+    out("="*60)
+    out(f"Total Builds: {summary['total_builds']}")
+    out(f"Successful: {summary['successful']}")
+    out(f"Errors: {summary['errors']}")
+    out(f"Measurable (real baseline DPS): {summary.get('measurable', summary['successful'])}")
     _na = summary.get('degenerate_na', 0)
     if _na:
-        print(f"N/A - calc gap, support PENDING (minion/warcry/non-damaging main): {_na}")
+        out(f"N/A - calc gap, support PENDING (minion/warcry/non-damaging main): {_na}")
         for _nm in summary.get('degenerate_builds', []):
-            print(f"    - {_nm}  [excluded from median until calc support lands]")
+            out(f"    - {_nm}  [excluded from median until calc support lands]")
 
     if summary['successful'] > 0:
-        print("\n" + "="*60)
-        print("OPTIMIZATION STATISTICS")
-        print("="*60)
+        out("\n" + "="*60)
+        out("OPTIMIZATION STATISTICS")
+        out("="*60)
         _meas = summary.get('measurable', summary['successful'])
-        print(f"(headline stats below are over MEASURABLE builds only)")
-        print(f"Success Rate: {summary['success_rate_pct']:.1f}% ({summary['builds_with_dps_improvement']}/{_meas} measurable builds improved)")
-        print(f"Median Improvement: {summary['median_improvement_pct']:.2f}%")
-        print(f"Mean Improvement: {summary['mean_improvement_pct']:.2f}%")
-        print(f"\nNodes Allocated:")
-        print(f"  Total: {summary['total_nodes_allocated']}")
-        print(f"  Median per build: {summary['median_nodes_added']:.0f}")
-        print(f"\nStat Improvements:")
-        print(f"  DPS gains: {summary['builds_with_dps_improvement']} builds (+{summary['total_dps_gain']:,.1f} total)")
-        print(f"  Life gains: {summary['builds_with_life_improvement']} builds (+{summary['total_life_gain']:,} total)")
-        print(f"  Mana gains: {summary['builds_with_mana_improvement']} builds (+{summary['total_mana_gain']:,} total)")
-        print(f"\nPerformance:")
-        print(f"  Max time: {summary['max_time_seconds']:.1f}s (target: <300s)")
-        print(f"  Mean time: {summary['mean_time_seconds']:.1f}s")
-        print(f"  Budget violations: {summary['budget_violations']} (target: 0)")
-
-    print("\n" + "="*60)
-    print("TASK 6 ACCEPTANCE CRITERIA")
-    print("="*60)
+        out(f"(headline stats below are over MEASURABLE builds only)")
+        out(f"Success Rate: {summary['success_rate_pct']:.1f}% ({summary['builds_with_dps_improvement']}/{_meas} measurable builds improved)")
+        out(f"Median Improvement: {summary['median_improvement_pct']:.2f}%")
+        out(f"Mean Improvement: {summary['mean_improvement_pct']:.2f}%")
+        out(f"\nNodes Allocated:")
+        out(f"  Total: {summary['total_nodes_allocated']}")
+        out(f"  Median per build: {summary['median_nodes_added']:.0f}")
+        out(f"\nStat Improvements:")
+        out(f"  DPS gains: {summary['builds_with_dps_improvement']} builds (+{summary['total_dps_gain']:,.1f} total)")
+        out(f"  Life gains: {summary['builds_with_life_improvement']} builds (+{summary['total_life_gain']:,} total)")
+        out(f"  Mana gains: {summary['builds_with_mana_improvement']} builds (+{summary['total_mana_gain']:,} total)")
+        out(f"\nPerformance:")
+        out(f"  Max time: {summary['max_time_seconds']:.1f}s (target: <300s)")
+        out(f"  Mean time: {summary['mean_time_seconds']:.1f}s")
+        out(f"  Budget violations: {summary['budget_violations']} (target: 0)")
+
+    out("\n" + "="*60)
+    out("TASK 6 ACCEPTANCE CRITERIA")
+    out("="*60)
 
     criteria = summary['task6_criteria']
 
     def status_icon(passed): return "[PASS]" if passed else "[FAIL]"
 
-    print(f"{status_icon(criteria['success_rate_70'])} Success rate >= 70%: {summary['success_rate_pct']:.1f}% (measurable builds)")
-    print(f"{status_icon(criteria['median_improvement_5'])} Median improvement >= 5%: {summary['median_improvement_pct']:.2f}% (measurable builds)")
-    print(f"{status_icon(criteria['all_under_5min'])} All completions < 5 minutes: {summary['max_time_seconds']:.1f}s")
-    print(f"{status_icon(criteria['zero_budget_violations'])} Zero budget violations: {summary['budget_violations']}")
+    out(f"{status_icon(criteria['success_rate_70'])} Success rate >= 70%: {summary['success_rate_pct']:.1f}% (measurable builds)")
+    out(f"{status_icon(criteria['median_improvement_5'])} Median improvement >= 5%: {summary['median_improvement_pct']:.2f}% (measurable builds)")
+    out(f"{status_icon(criteria['all_under_5min'])} All completions < 5 minutes: {summary['max_time_seconds']:.1f}s")
+    out(f"{status_icon(criteria['zero_budget_violations'])} Zero budget violations: {summary['budget_violations']}")
 
-    print("\n" + "="*60)
+    out("\n" + "="*60)
     if criteria['overall_pass']:
-        print("[PASS] EPIC 2 VALIDATION: PASSED")
-        print("All acceptance criteria met!")
+        out("[PASS] EPIC 2 VALIDATION: PASSED")
+        out("All acceptance criteria met!")
     else:
-        print("[FAIL] EPIC 2 VALIDATION: FAILED")
-        print("Some acceptance criteria not met (see above)")
-    print("="*60 + "\n")
+        out("[FAIL] EPIC 2 VALIDATION: FAILED")
+        out("Some acceptance criteria not met (see above)")
+    out("="*60 + "\n")
+
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/aggregate_epic2_results.py <results_dir>")
-        print("\nExample:")
-        print("  python scripts/aggregate_epic2_results.py /tmp/pytest-of-user/pytest-current/epic2_results0")
-        sys.exit(1)
-
-    results_dir = Path(sys.argv[1])
+    parser = argparse.ArgumentParser(
+        description="Aggregate Epic 2 validation results into the final report.",
+        epilog="Example: python scripts/aggregate_epic2_results.py "
+               "/tmp/pytest-of-user/pytest-current/epic2_results0",
+    )
+    parser.add_argument("results_dir", type=Path, help="Directory of per-build result JSON files")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Write the saved report indented (default: compact, streamed)")
+    args = parser.parse_args()
+
+    results_dir = args.results_dir
 
     # Load results
     print(f"Loading results from: {results_dir}")
@@ -267,17 +346,14 @@ def main():
     output_file = Path("docs/validation/realistic-validation-results.json")
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    output_data = {
+    header = {
         "timestamp": datetime.now().isoformat(),
         "corpus": "tests/fixtures/realistic_builds/",
         "optimization_budget": 20,
         "max_time_seconds": 300,
-        "summary": summary,
-        "results": results
     }
 
-    with open(output_file, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    _write_report(output_file, header, summary, results, pretty=args.pretty)
 
     print(f"Results saved to: {output_file}")
 
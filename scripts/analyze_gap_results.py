@@ -6,7 +6,11 @@ This script:
 3. Creates a categorized summary of failures
 """
 
+import functools
 import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -14,100 +18,150 @@ import sys
 repo_root = Path(__file__).parent.parent
 sys.path.insert(0, str(repo_root))
 
-from src.parsers.xml_utils import parse_xml
+from _xml_cache import parse_xml_file
 
 
 def get_skill_info_from_xml(xml_path: Path):
-    """Extract main skill information from build XML."""
+    """Extract main skill information from build XML.
+
+    Cached per (path, mtime): build XMLs don't change during a run, so each
+    file is parsed once no matter how many results point at it.
+    """
     try:
-        xml_str = xml_path.read_text(encoding='utf-8')
-        data = parse_xml(xml_str)
+        mtime_ns = xml_path.stat().st_mtime_ns
+    except OSError as e:
+        return [{"name": "Error", "id": str(e), "level": "0"}]
+    return [dict(skill) for skill in _cached_skill_info(str(xml_path), mtime_ns)]
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_skill_info(xml_path: str, mtime_ns: int) -> tuple:
+    """Hashable (tuple-of-items) form of _read_skill_info, memoized."""
+    return tuple(tuple(skill.items()) for skill in _read_skill_info(Path(xml_path)))
+
+
+def _as_list(value):
+    """Normalize a parsed XML child (dict, list or None) to a list."""
+    if type(value) is dict:
+        return [value]
+    return value or []
+
+
+def _read_skill_info(xml_path: Path):
+    """Parse the build XML and return its main skills (uncached)."""
+    try:
+        data = parse_xml_file(xml_path)
 
         pob_root = data.get("PathOfBuilding2") or data.get("PathOfBuilding")
         skills_section = pob_root.get("Skills", {})
 
         # Get skill groups
-        skill_groups = skills_section.get("SkillSet", {}).get("SkillGroup", [])
-        if isinstance(skill_groups, dict):
-            skill_groups = [skill_groups]
+        skill_groups = _as_list(skills_section.get("SkillSet", {}).get("SkillGroup"))
 
         main_skills = []
         for group in skill_groups:
             # Get the first skill gem in each group (main skill)
-            gems = group.get("Gem", [])
-            if isinstance(gems, dict):
-                gems = [gems]
+            gems = _as_list(group.get("Gem"))
 
             for gem in gems:
-                if gem.get("@enabled") != "false":
-                    skill_name = gem.get("@nameSpec", gem.get("@skillId", "Unknown"))
-                    skill_id = gem.get("@skillId")
-                    if skill_id and not skill_id.endswith("Support"):
-                        main_skills.append({
-                            "name": skill_name,
-                            "id": skill_id,
-                            "level": gem.get("@level", "1")
-                        })
-                        break  # Only get first active skill from each group
+                # Cheapest discriminators first: supports and id-less gems, then disabled
+                skill_id = gem.get("@skillId")
+                if not skill_id or skill_id.endswith("Support"):
+                    continue
+                if gem.get("@enabled") == "false":
+                    continue
+                main_skills.append({
+                    "name": gem.get("@nameSpec", skill_id),
+                    "id": skill_id,
+                    "level": gem.get("@level", "1")
+                })
+                break  # Only get first active skill from each group
 
         return main_skills
     except Exception as e:
         return [{"name": "Error", "id": str(e), "level": "0"}]
 
 
+def _load_all_skills(builds_dir: Path, build_names) -> dict:
+    """Map build name -> main skills for every wanted ``*.xml`` in builds_dir.
+
+    Lists the directory once and reads/parses the files on a thread pool so
+    the per-file I/O overlaps. Builds without an XML file are left out; the
+    caller falls back to get_skill_info_from_xml() for its error entry.
+    """
+    wanted = set(build_names)
+    with os.scandir(builds_dir) as entries:
+        paths = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".xml") and entry.name[:-4] in wanted
+        ]
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return dict(zip((p.stem for p in paths), executor.map(get_skill_info_from_xml, paths)))
+
+
+# Category keywords, in priority order: the first category with ANY keyword in
+# the name wins. Each alternative is a lookahead anchored at position 0, so a
+# single match() tries the categories in order (leftmost-match semantics
+# would otherwise let e.g. "frost" in "Frost Arrow" beat the attack keyword).
+_SKILL_CATEGORIES = (
+    ("attack", ("arrow", "strike", "slam", "shot", "throw", "spear", "ballista")),
+    ("dot", ("remnants", "essence drain", "poison", "bleed", "ignite")),
+    ("spell", ("mage", "frost", "storm", "fireball", "ice", "lightning")),
+    ("minion", ("minion", "summon", "zombie", "skeleton")),
+    ("totem", ("totem", "trap", "mine")),
+    ("warcry", ("cry", "shout")),
+)
+_CATEGORY_RE = re.compile("|".join(
+    f"(?P<{group}>(?=.*(?:{'|'.join(map(re.escape, words))})))"
+    for group, words in _SKILL_CATEGORIES
+), re.DOTALL)
+_CATEGORY_LABELS = {"totem": "totem/trap/mine"}
+
+# Spell skills whose names contain an attack keyword ("spear", "throw")
+_SPELL_OVERRIDES = ("lightning spear", "spectral throw")
+
+
+@functools.lru_cache(maxsize=512)
 def categorize_skill_type(skill_name: str, skill_id: str = None):
     """Categorize skill by type based on name patterns."""
     name_lower = skill_name.lower()
 
-    # Attack skills
-    if any(word in name_lower for word in ["arrow", "strike", "slam", "shot", "throw", "spear", "ballista"]):
-        # Check if it's actually a spell version
-        if "lightning spear" in name_lower or "spectral throw" in name_lower:
-            return "spell"
-        return "attack"
-
-    # DOT skills
-    if any(word in name_lower for word in ["remnants", "essence drain", "poison", "bleed", "ignite"]):
-        return "dot"
-
-    # Spell skills
-    if any(word in name_lower for word in ["mage", "frost", "storm", "fireball", "ice", "lightning"]):
+    # Check if it's actually a spell version of an attack-named skill
+    if any(override in name_lower for override in _SPELL_OVERRIDES):
         return "spell"
 
-    # Minion skills
-    if any(word in name_lower for word in ["minion", "summon", "zombie", "skeleton"]):
-        return "minion"
-
-    # Totem/trap/mine
-    if any(word in name_lower for word in ["totem", "trap", "mine"]):
-        return "totem/trap/mine"
-
-    # Warcry
-    if "cry" in name_lower or "shout" in name_lower:
-        return "warcry"
-
-    # Fallback
-    return "unknown"
+    match = _CATEGORY_RE.match(name_lower)
+    if match is None:
+        # Fallback
+        return "unknown"
+    return _CATEGORY_LABELS.get(match.lastgroup, match.lastgroup)
 
 
 def main():
     """Main analysis function."""
     # Load results JSON
     results_path = repo_root / "docs/validation/realistic-validation-results.json"
-    with open(results_path) as f:
-        results_data = json.load(f)
+    results_data = json.loads(results_path.read_bytes())
 
     # Builds directory
     builds_dir = repo_root / "tests/fixtures/realistic_builds"
 
+    # Extract skill info for every build up front (one directory scan)
+    skills_by_build = _load_all_skills(
+        builds_dir, (result["build_name"] for result in results_data["results"])
+    )
+
     # Analyze each build
     analysis = []
     for result in results_data["results"]:
         build_name = result["build_name"]
-        xml_path = builds_dir / f"{build_name}.xml"
 
         # Get skill info
-        skills = get_skill_info_from_xml(xml_path)
+        skills = skills_by_build.get(build_name)
+        if skills is None:
+            skills = get_skill_info_from_xml(builds_dir / f"{build_name}.xml")
         main_skill = skills[0] if skills else {"name": "Unknown", "id": "Unknown", "level": "0"}
 
         # Categorize
@@ -6,7 +6,7 @@ This script demonstrates the hill climbing optimizer functionality by:
 3. Displaying detailed before/after stats and improvement metrics
 
 Usage:
-    python scripts/demo_optimization.py [--metric {dps,ehp,balanced}] [--build BUILD_NAME]
+    python scripts/demo_optimization.py [--metric {dps,ehp,balanced}] [--build BUILD_NAME] [--quiet]
 
 Examples:
     python scripts/demo_optimization.py
@@ -30,14 +30,10 @@ from typing import Set, List, Optional
 from src.models.build_data import BuildData, CharacterClass, Item, Skill
 from src.models.optimization_config import OptimizationConfiguration
 from src.optimizer.hill_climbing import optimize_build
-from src.parsers.xml_utils import parse_xml
+from src.parsers.pob_parser import parse_node_ids
+from _xml_cache import parse_xml_file
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -58,8 +54,7 @@ def load_build_from_xml_file(xml_path: Path) -> BuildData:
         raise FileNotFoundError(f"Build file not found: {xml_path}")
 
     # Read and parse XML
-    xml_str = xml_path.read_text(encoding='utf-8')
-    data = parse_xml(xml_str)
+    data = parse_xml_file(xml_path)
 
     # Extract build data (same logic as pob_parser.py but without Base64/zlib)
     pob_root = data.get("PathOfBuilding2") or data.get("PathOfBuilding")
@@ -89,7 +84,7 @@ def load_build_from_xml_file(xml_path: Path) -> BuildData:
     passive_nodes: Set[int] = set()
     if nodes_str:
         try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
+            passive_nodes = parse_node_ids(nodes_str)
         except ValueError:
             pass
 
@@ -106,9 +101,16 @@ def load_build_from_xml_file(xml_path: Path) -> BuildData:
     )
 
 
+# The two separators the demo actually prints, built once
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 80
+_SEPARATORS = {"=": _SEP_EQ, "-": _SEP_DASH}
+
+
 def print_separator(char="=", length=80):
     """Print a visual separator line."""
-    print(char * length)
+    sep = _SEPARATORS.get(char) if length == 80 else None
+    print(sep if sep is not None else char * length)
 
 
 def print_build_info(build: BuildData):
@@ -209,9 +211,20 @@ def main():
         action="store_true",
         help="List all available builds and exit"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors (skips per-iteration INFO logging)"
+    )
 
     args = parser.parse_args()
 
+    # Configure logging (here, not at import, so importers keep their own setup)
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     # Setup paths
     parity_builds_path = Path("tests/fixtures/parity_builds")
     if not parity_builds_path.exists():
@@ -270,9 +283,9 @@ def main():
     print(f"  Timeout:           {config.max_time_seconds}s")
 
     # Run optimization
-    print("\n" + "=" * 80)
+    print("\n" + _SEP_EQ)
     print("Running optimization...")
-    print("=" * 80 + "\n")
+    print(_SEP_EQ + "\n")
 
     try:
         result = optimize_build(config)
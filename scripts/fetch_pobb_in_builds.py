@@ -9,70 +9,158 @@ This script:
 
 Usage:
     python scripts/fetch_pobb_in_builds.py
+
+Re-runs send conditional GETs (ETag / Last-Modified saved under
+.cache/pobb_validators/) and leave builds that answer 304 untouched.
 """
 
-import base64
-import zlib
+import json
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# pybase64 (optional) is a SIMD drop-in for the stdlib decoder
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Likewise isal's zlib (ISA-L inflate) over the stdlib reference zlib
+try:
+    from isal import isal_zlib as zlib
+except ImportError:
+    import zlib
+
+# Shared keep-alive session: one TLS handshake per pooled connection instead of
+# one per build. requests.Session is safe for concurrent GETs like these.
+# Transient failures (connection resets, 502/503/504) are retried up to 3 times
+# with exponential backoff (0.25s, 0.5s, 1s) before a build counts as failed.
+MAX_WORKERS = 8
+
 
+class _BackoffRetry(Retry):
+    """Retry that also waits before the first retry.
 
-def fetch_pobb_in_build(code: str) -> Optional[str]:
+    urllib3 returns 0 from get_backoff_time() for the first retry, so a 502 or
+    reset would be retried immediately; floor it at backoff_factor instead.
+    """
+
+    def get_backoff_time(self) -> float:
+        return max(super().get_backoff_time(), self.backoff_factor)
+
+
+RETRY = _BackoffRetry(
+    total=3,
+    backoff_factor=0.25,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=RETRY))
+
+# ETag / Last-Modified of the last saved copy of each build, one sidecar JSON
+# per output file. Lets re-runs send conditional GETs and skip unchanged builds.
+VALIDATORS_DIR = Path(__file__).parent.parent / ".cache" / "pobb_validators"
+
+# Returned by fetch_pobb_in_build() when pobb.in answers 304 Not Modified
+NOT_MODIFIED = object()
+
+
+def load_validators(filename: str, output_dir: Path) -> dict:
+    """Return saved cache validators for ``filename`` ({} if none or no XML)."""
+    if not (output_dir / filename).exists():
+        return {}
+    try:
+        return json.loads((VALIDATORS_DIR / f"{filename}.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_validators(filename: str, validators: dict):
+    """Persist cache validators for ``filename`` (no-op if the server sent none)."""
+    if not any(validators.values()):
+        return
+    VALIDATORS_DIR.mkdir(parents=True, exist_ok=True)
+    (VALIDATORS_DIR / f"{filename}.json").write_text(json.dumps(validators), encoding='utf-8')
+
+
+def fetch_pobb_in_build(code: str, validators: Optional[dict] = None) -> Tuple[object, dict]:
     """
     Fetch a build from pobb.in and decode it to XML.
 
     Args:
         code: The pobb.in short code (e.g., "hRn2ApGTu-5z")
+        validators: {"etag", "last_modified"} from the previous fetch; sent as
+            If-None-Match / If-Modified-Since
 
     Returns:
-        XML string of the build, or None if fetch failed
+        (xml, validators): xml is the build's UTF-8 XML bytes, NOT_MODIFIED
+        if the saved copy is current, or None if fetch failed; validators
+        are the response's cache validators (to pass to save_validators)
     """
     # Use the /raw endpoint to get base64 data directly
     url = f"https://pobb.in/{code}/raw"
     headers = {
         "User-Agent": "poe2-optimizer/1.0 github.com/alec (testing build fetcher)"
     }
+    validators = validators or {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
 
     try:
         # Fetch the raw base64 data
-        response = requests.get(url, headers=headers, timeout=10)
+        response = SESSION.get(url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return NOT_MODIFIED, validators
         response.raise_for_status()
+        new_validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
 
-        base64_data = response.text.strip()
+        # Work on the raw body bytes: skips the charset decode to str and
+        # strips whitespace in one C-level pass
+        base64_data = response.content.translate(None, b" \t\r\n")
 
         # Decode base64
         try:
             decoded_bytes = base64.b64decode(base64_data)
         except Exception as e:
             print(f"[FAIL] Base64 decode failed for {code}: {e}")
-            return None
+            return None, {}
+        del base64_data
 
         # Decompress with zlib
         try:
             xml_bytes = zlib.decompress(decoded_bytes)
         except Exception as e:
             print(f"[FAIL] Zlib decompress failed for {code}: {e}")
-            return None
-
-        # Convert to string
-        xml_string = xml_bytes.decode('utf-8')
+            return None, {}
+        del decoded_bytes
 
-        return xml_string
+        # Returned as bytes: the caller only writes it back out, so a
+        # decode/encode round trip would be pure overhead
+        return xml_bytes, new_validators
 
     except requests.RequestException as e:
         print(f"[FAIL] Failed to fetch {url}: {e}")
-        return None
+        return None, {}
 
 
-def save_build_xml(xml_string: str, filename: str, output_dir: Path):
-    """Save XML string to file."""
+def save_build_xml(xml_bytes: bytes, filename: str, output_dir: Path):
+    """Save XML bytes to file."""
     output_dir.mkdir(parents=True, exist_ok=True)
     filepath = output_dir / filename
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(xml_string)
+    filepath.write_bytes(xml_bytes)
 
     print(f"[OK] Saved: {filepath}")
 
@@ -99,22 +187,41 @@ def main():
     print(f"Output directory: {output_dir}\n")
 
     successful = 0
+    unchanged = 0
     failed = 0
 
-    for build in builds:
-        print(f"Fetching {build['code']} ({build['name']})...")
-        xml = fetch_pobb_in_build(build['code'])
-
-        if xml:
-            save_build_xml(xml, build['name'], output_dir)
-            successful += 1
-        else:
-            failed += 1
-
+    # Fetch concurrently (network-bound); save on the main thread as results land
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for build in builds:
+            print(f"Fetching {build['code']} ({build['name']})...")
+            validators = load_validators(build['name'], output_dir)
+            futures[executor.submit(fetch_pobb_in_build, build['code'], validators)] = build
         print()
 
+        for future in as_completed(futures):
+            build = futures[future]
+            try:
+                xml, validators = future.result()
+            except Exception as e:
+                print(f"[FAIL] Unexpected error fetching {build['code']}: {e}")
+                xml = None
+
+            if xml is NOT_MODIFIED:
+                print(f"[OK] Unchanged: {output_dir / build['name']}")
+                successful += 1
+                unchanged += 1
+            elif xml:
+                save_build_xml(xml, build['name'], output_dir)
+                save_validators(build['name'], validators)
+                successful += 1
+            else:
+                failed += 1
+
     print(f"\n{'='*60}")
     print(f"[OK] Successfully fetched: {successful}/{len(builds)}")
+    if unchanged > 0:
+        print(f"     Unchanged since last fetch (304): {unchanged}")
     if failed > 0:
         print(f"[FAIL] Failed: {failed}/{len(builds)}")
     print(f"{'='*60}")
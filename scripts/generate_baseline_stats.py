@@ -19,12 +19,16 @@ sys.path.insert(0, str(repo_root))
 
 import json
 import logging
-from typing import Set, Dict, Any, List
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import FrozenSet, Dict, Any, List, Optional, Tuple
 from statistics import mean, median, stdev
 
 from src.models.build_data import BuildData, CharacterClass
 from src.calculator.build_calculator import calculate_build_stats
-from src.parsers.xml_utils import parse_xml
+from src.parsers.pob_parser import parse_node_ids
+from _build_header import read_build_header
+from _json_io import write_json
 
 # Configure logging - suppress MinimalCalc debug output
 logging.basicConfig(
@@ -43,6 +47,10 @@ logger.addHandler(console)
 logger.propagate = False  # Don't propagate to root logger
 
 
+# Plain dict lookup for className -> CharacterClass (skips Enum.__call__ per build)
+_CLASS_BY_NAME = {cls.value: cls for cls in CharacterClass}
+
+
 def load_build_from_xml_file(xml_path: Path) -> BuildData:
     """Load BuildData directly from XML file.
 
@@ -56,44 +64,40 @@ def load_build_from_xml_file(xml_path: Path) -> BuildData:
         FileNotFoundError: If XML file doesn't exist
         Exception: If parsing fails
     """
-    if not xml_path.exists():
-        raise FileNotFoundError(f"Build file not found: {xml_path}")
-
-    # Read and parse XML
-    xml_str = xml_path.read_text(encoding='utf-8')
-    data = parse_xml(xml_str)
-
-    # Extract build data
-    pob_root = data.get("PathOfBuilding2") or data.get("PathOfBuilding")
-    if not pob_root:
-        raise ValueError("Missing PathOfBuilding or PathOfBuilding2 root element")
-
-    build_section = pob_root.get("Build")
+    # Only the <Build> and <Tree><Spec> attributes are needed; read just those.
+    # The open itself reports a missing file (no separate exists() stat).
+    try:
+        build_section, spec = read_build_header(xml_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Build file not found: {xml_path}") from e
     if not build_section:
         raise ValueError("Missing Build section in PoB XML")
 
     # Extract character data
-    class_name = build_section.get("@className")
-    character_class = CharacterClass(class_name) if class_name else CharacterClass.WITCH
-
-    level_str = build_section.get("@level", "90")
+    class_name = build_section.get("className")
+    if not class_name:
+        character_class = CharacterClass.WITCH
+    elif class_name in _CLASS_BY_NAME:
+        character_class = _CLASS_BY_NAME[class_name]
+    else:
+        character_class = CharacterClass(class_name)  # raises the usual ValueError
+
+    level_str = build_section.get("level", "90")
     level = int(level_str)
 
-    ascendancy = build_section.get("@ascendClassName")
+    ascendancy = build_section.get("ascendClassName")
     if ascendancy == "None":
         ascendancy = None
 
-    # Extract passive tree
-    tree_section = pob_root.get("Tree", {})
-    spec = tree_section.get("Spec", {}) if isinstance(tree_section, dict) else {}
-    nodes_str = spec.get("@nodes", "") if isinstance(spec, dict) else ""
+    # Extract passive tree (multi-Spec builds load with an empty tree)
+    nodes_str = (spec or {}).get("nodes", "")
 
-    passive_nodes: Set[int] = set()
-    if nodes_str:
-        try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
-        except ValueError:
-            pass
+    # Frozen: baseline builds are only read, and frozenset() of a frozenset is
+    # free for any downstream cache key
+    try:
+        passive_nodes: FrozenSet[int] = frozenset(parse_node_ids(nodes_str))
+    except ValueError:
+        passive_nodes = frozenset()
 
     # Create BuildData
     return BuildData(
@@ -101,13 +105,88 @@ def load_build_from_xml_file(xml_path: Path) -> BuildData:
         level=level,
         ascendancy=ascendancy,
         passive_nodes=passive_nodes,
-        tree_version=build_section.get("@targetVersion", "0_1"),
-        build_name=build_section.get("@buildName"),
+        tree_version=build_section.get("targetVersion", "0_1"),
+        build_name=build_section.get("buildName"),
         items=[],
         skills=[]
     )
 
 
+def _process_build(entry: Tuple[str, str, str]) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """Load one corpus build and calculate its baseline stats.
+
+    Top-level (picklable) so main() can run it in a ProcessPoolExecutor.
+
+    Args:
+        entry: (build_id, filename, builds_dir)
+
+    Returns:
+        (build_id, build_stat, error): build_stat is None on failure, with
+        error holding the exception message
+    """
+    build_id, filename, builds_dir = entry
+    try:
+        # Load build from XML
+        build = load_build_from_xml_file(Path(builds_dir) / filename)
+
+        # Calculate stats using Epic 1 calculator
+        stats = calculate_build_stats(build)
+    except Exception as e:
+        return build_id, None, str(e)
+
+    # Record baseline stats
+    res = stats.resistances or {}
+    total_points_available = build.level + 23  # PoE 2 formula
+    build_stat = {
+        'build_id': build_id,
+        'filename': filename,
+        'character_class': build.character_class.value,
+        'level': build.level,
+        'ascendancy': build.ascendancy,
+        'allocated_points': build.allocated_point_count,
+        'unallocated_points': build.unallocated_points,
+        'total_points_available': total_points_available,
+        'baseline_stats': {
+            'total_dps': stats.total_dps,
+            'life': stats.life,
+            'effective_hp': stats.effective_hp,
+            'energy_shield': stats.energy_shield,
+            'evasion': stats.evasion,
+            'armour': stats.armour,
+            'fire_res': res.get('fire', 0),
+            'cold_res': res.get('cold', 0),
+            'lightning_res': res.get('lightning', 0),
+            'chaos_res': res.get('chaos', 0)
+        },
+        # Flatten for easier stats calculation
+        'total_dps': stats.total_dps,
+        'life': stats.life,
+        'effective_hp': stats.effective_hp
+    }
+    return build_id, build_stat, None
+
+
+def _distribution(values: List[float], with_stdev: bool = True) -> Dict[str, Any]:
+    """mean/median/min/max (and sample stdev) of ``values``; zeros when empty.
+
+    Sorts once: min/max are the ends of the sorted list and median() on
+    already-sorted input is a linear Timsort pass.
+    """
+    if not values:
+        dist = {'mean': 0, 'median': 0, 'min': 0, 'max': 0}
+    else:
+        ordered = sorted(values)
+        dist = {
+            'mean': mean(ordered),
+            'median': median(ordered),
+            'min': ordered[0],
+            'max': ordered[-1]
+        }
+    if with_stdev:
+        dist['stdev'] = stdev(values) if len(values) > 1 else 0
+    return dist
+
+
 def calculate_corpus_statistics(build_stats: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Calculate aggregate statistics across all builds.
 
@@ -117,58 +196,45 @@ def calculate_corpus_statistics(build_stats: List[Dict[str, Any]]) -> Dict[str,
     Returns:
         Dictionary with corpus-level statistics
     """
-    # Extract numeric values
-    dps_values = [b['total_dps'] for b in build_stats if b['total_dps'] > 0]
-    life_values = [b['life'] for b in build_stats if b['life'] > 0]
-    ehp_values = [b['effective_hp'] for b in build_stats if b['effective_hp'] > 0]
-    allocated_values = [b['allocated_points'] for b in build_stats]
-    unallocated_values = [b['unallocated_points'] for b in build_stats]
-    level_values = [b['level'] for b in build_stats]
+    # Extract numeric values in one pass over the builds
+    dps_values = []
+    life_values = []
+    ehp_values = []
+    allocated_values = []
+    unallocated_values = []
+    level_values = []
+    zero_dps = 0
+    with_unallocated = 0
+
+    for b in build_stats:
+        dps = b['total_dps']
+        if dps > 0:
+            dps_values.append(dps)
+        elif dps == 0:
+            zero_dps += 1
+        if b['life'] > 0:
+            life_values.append(b['life'])
+        if b['effective_hp'] > 0:
+            ehp_values.append(b['effective_hp'])
+        allocated_values.append(b['allocated_points'])
+        unallocated_values.append(b['unallocated_points'])
+        if b['unallocated_points'] > 0:
+            with_unallocated += 1
+        level_values.append(b['level'])
+
+    unallocated_stats = _distribution(unallocated_values, with_stdev=False)
+    unallocated_stats['builds_with_unallocated'] = with_unallocated
 
     stats = {
         'total_builds': len(build_stats),
         'builds_with_dps': len(dps_values),
-        'builds_with_zero_dps': len([b for b in build_stats if b['total_dps'] == 0]),
-        'dps_stats': {
-            'mean': mean(dps_values) if dps_values else 0,
-            'median': median(dps_values) if dps_values else 0,
-            'min': min(dps_values) if dps_values else 0,
-            'max': max(dps_values) if dps_values else 0,
-            'stdev': stdev(dps_values) if len(dps_values) > 1 else 0
-        },
-        'life_stats': {
-            'mean': mean(life_values) if life_values else 0,
-            'median': median(life_values) if life_values else 0,
-            'min': min(life_values) if life_values else 0,
-            'max': max(life_values) if life_values else 0,
-            'stdev': stdev(life_values) if len(life_values) > 1 else 0
-        },
-        'ehp_stats': {
-            'mean': mean(ehp_values) if ehp_values else 0,
-            'median': median(ehp_values) if ehp_values else 0,
-            'min': min(ehp_values) if ehp_values else 0,
-            'max': max(ehp_values) if ehp_values else 0,
-            'stdev': stdev(ehp_values) if len(ehp_values) > 1 else 0
-        },
-        'allocated_points_stats': {
-            'mean': mean(allocated_values),
-            'median': median(allocated_values),
-            'min': min(allocated_values),
-            'max': max(allocated_values)
-        },
-        'unallocated_points_stats': {
-            'mean': mean(unallocated_values),
-            'median': median(unallocated_values),
-            'min': min(unallocated_values),
-            'max': max(unallocated_values),
-            'builds_with_unallocated': len([v for v in unallocated_values if v > 0])
-        },
-        'level_stats': {
-            'mean': mean(level_values),
-            'median': median(level_values),
-            'min': min(level_values),
-            'max': max(level_values)
-        }
+        'builds_with_zero_dps': zero_dps,
+        'dps_stats': _distribution(dps_values),
+        'life_stats': _distribution(life_values),
+        'ehp_stats': _distribution(ehp_values),
+        'allocated_points_stats': _distribution(allocated_values, with_stdev=False),
+        'unallocated_points_stats': unallocated_stats,
+        'level_stats': _distribution(level_values, with_stdev=False)
     }
 
     return stats
@@ -202,57 +268,24 @@ def main():
     successful = 0
     failed = 0
 
-    for idx, build_entry in enumerate(manifest['builds'], 1):
-        build_id = build_entry['build_id']
-        filename = build_entry['filename']
-        xml_path = builds_dir / filename
-
-        logger.info(f"[{idx}/{total_builds}] Processing: {build_id}")
-
-        try:
-            # Load build from XML
-            build = load_build_from_xml_file(xml_path)
-
-            # Calculate stats using Epic 1 calculator
-            stats = calculate_build_stats(build)
-
-            # Record baseline stats
-            total_points_available = build.level + 23  # PoE 2 formula
-            build_stat = {
-                'build_id': build_id,
-                'filename': filename,
-                'character_class': build.character_class.value,
-                'level': build.level,
-                'ascendancy': build.ascendancy,
-                'allocated_points': build.allocated_point_count,
-                'unallocated_points': build.unallocated_points,
-                'total_points_available': total_points_available,
-                'baseline_stats': {
-                    'total_dps': stats.total_dps,
-                    'life': stats.life,
-                    'effective_hp': stats.effective_hp,
-                    'energy_shield': stats.energy_shield,
-                    'evasion': stats.evasion,
-                    'armour': stats.armour,
-                    'fire_res': stats.resistances.get('fire', 0),
-                    'cold_res': stats.resistances.get('cold', 0),
-                    'lightning_res': stats.resistances.get('lightning', 0),
-                    'chaos_res': stats.resistances.get('chaos', 0)
-                },
-                # Flatten for easier stats calculation
-                'total_dps': stats.total_dps,
-                'life': stats.life,
-                'effective_hp': stats.effective_hp
-            }
+    # Each build is independent and CPU-bound (XML parse + Lua calculation), so
+    # fan out across processes. map() keeps results in manifest order.
+    entries = [(e['build_id'], e['filename'], str(builds_dir)) for e in manifest['builds']]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_process_build, entries, chunksize=4)
+        for idx, (build_id, build_stat, error) in enumerate(results, 1):
+            logger.info(f"[{idx}/{total_builds}] Processed: {build_id}")
+
+            if build_stat is None:
+                logger.error(f"  ✗ Failed: {error}")
+                failed += 1
+                continue
 
             build_stats.append(build_stat)
             successful += 1
 
-            logger.info(f"  ✓ DPS={stats.total_dps:,.0f}, Life={stats.life:,}, EHP={stats.effective_hp:,.0f}")
-
-        except Exception as e:
-            logger.error(f"  ✗ Failed: {e}")
-            failed += 1
+            logger.info(f"  ✓ DPS={build_stat['total_dps']:,.0f}, Life={build_stat['life']:,}, "
+                        f"EHP={build_stat['effective_hp']:,.0f}")
 
     logger.info("-"*80)
     logger.info(f"Completed: {successful} successful, {failed} failed")
@@ -265,29 +298,33 @@ def main():
     corpus_stats = calculate_corpus_statistics(build_stats)
 
     # Print summary statistics
-    logger.info("\nCORPUS STATISTICS:")
-    logger.info("-"*80)
-    logger.info(f"Total builds: {corpus_stats['total_builds']}")
-    logger.info(f"Builds with DPS > 0: {corpus_stats['builds_with_dps']}")
-    logger.info(f"Builds with zero DPS: {corpus_stats['builds_with_zero_dps']}")
-    logger.info(f"\nDPS:  Mean={corpus_stats['dps_stats']['mean']:,.0f}, "
-                f"Median={corpus_stats['dps_stats']['median']:,.0f}, "
-                f"Range=[{corpus_stats['dps_stats']['min']:,.0f}, {corpus_stats['dps_stats']['max']:,.0f}]")
-    logger.info(f"Life: Mean={corpus_stats['life_stats']['mean']:,.0f}, "
-                f"Median={corpus_stats['life_stats']['median']:,.0f}, "
-                f"Range=[{corpus_stats['life_stats']['min']:,}, {corpus_stats['life_stats']['max']:,}]")
-    logger.info(f"EHP:  Mean={corpus_stats['ehp_stats']['mean']:,.0f}, "
-                f"Median={corpus_stats['ehp_stats']['median']:,.0f}, "
-                f"Range=[{corpus_stats['ehp_stats']['min']:,.0f}, {corpus_stats['ehp_stats']['max']:,.0f}]")
-    logger.info(f"\nAllocated Points: Mean={corpus_stats['allocated_points_stats']['mean']:.1f}, "
-                f"Median={corpus_stats['allocated_points_stats']['median']:.0f}, "
-                f"Range=[{corpus_stats['allocated_points_stats']['min']}, {corpus_stats['allocated_points_stats']['max']}]")
-    logger.info(f"Unallocated Points: Mean={corpus_stats['unallocated_points_stats']['mean']:.1f}, "
-                f"Median={corpus_stats['unallocated_points_stats']['median']:.0f}, "
-                f"Builds with unallocated: {corpus_stats['unallocated_points_stats']['builds_with_unallocated']}")
-    logger.info(f"\nLevel: Mean={corpus_stats['level_stats']['mean']:.1f}, "
-                f"Median={corpus_stats['level_stats']['median']:.0f}, "
-                f"Range=[{corpus_stats['level_stats']['min']}, {corpus_stats['level_stats']['max']}]")
+    # One logger call for the whole block (single handler/lock round trip)
+    dps = corpus_stats['dps_stats']
+    life = corpus_stats['life_stats']
+    ehp = corpus_stats['ehp_stats']
+    allocated = corpus_stats['allocated_points_stats']
+    unallocated = corpus_stats['unallocated_points_stats']
+    levels = corpus_stats['level_stats']
+    summary_lines = [
+        "\nCORPUS STATISTICS:",
+        "-"*80,
+        f"Total builds: {corpus_stats['total_builds']}",
+        f"Builds with DPS > 0: {corpus_stats['builds_with_dps']}",
+        f"Builds with zero DPS: {corpus_stats['builds_with_zero_dps']}",
+        f"\nDPS:  Mean={dps['mean']:,.0f}, Median={dps['median']:,.0f}, "
+        f"Range=[{dps['min']:,.0f}, {dps['max']:,.0f}]",
+        f"Life: Mean={life['mean']:,.0f}, Median={life['median']:,.0f}, "
+        f"Range=[{life['min']:,}, {life['max']:,}]",
+        f"EHP:  Mean={ehp['mean']:,.0f}, Median={ehp['median']:,.0f}, "
+        f"Range=[{ehp['min']:,.0f}, {ehp['max']:,.0f}]",
+        f"\nAllocated Points: Mean={allocated['mean']:.1f}, Median={allocated['median']:.0f}, "
+        f"Range=[{allocated['min']}, {allocated['max']}]",
+        f"Unallocated Points: Mean={unallocated['mean']:.1f}, Median={unallocated['median']:.0f}, "
+        f"Builds with unallocated: {unallocated['builds_with_unallocated']}",
+        f"\nLevel: Mean={levels['mean']:.1f}, Median={levels['median']:.0f}, "
+        f"Range=[{levels['min']}, {levels['max']}]",
+    ]
+    logger.info("\n".join(summary_lines))
 
     # Prepare output
     output_data = {
@@ -302,8 +339,7 @@ def main():
 
     # Save to file
     logger.info(f"\nSaving baseline stats to: {output_path}")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    write_json(output_path, output_data)
 
     logger.info("="*80)
     logger.info("✓ Task 5 Complete!")
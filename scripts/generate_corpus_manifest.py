@@ -6,9 +6,9 @@ a comprehensive manifest with metadata extracted from each XML file.
 Output: tests/fixtures/optimization_corpus/corpus_manifest.json
 """
 
-import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 import re
@@ -17,7 +17,8 @@ import re
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.parsers.pob_parser import parse_pob_code
-from src.parsers.xml_utils import parse_xml
+from _build_header import read_build_header
+from _json_io import write_json
 
 
 def extract_build_metadata(xml_path: Path) -> Dict:
@@ -30,35 +31,27 @@ def extract_build_metadata(xml_path: Path) -> Dict:
         Dictionary with build metadata
     """
     try:
-        # Read XML file
-        with open(xml_path, 'r', encoding='utf-8') as f:
-            xml_content = f.read()
-
-        # Parse XML
-        data = parse_xml(xml_content)
-
-        # Extract from PathOfBuilding2 or PathOfBuilding root
-        pob_root = data.get("PathOfBuilding2") or data.get("PathOfBuilding")
-        if not pob_root:
-            return None
-
-        build_section = pob_root.get("Build", {})
+        # Only the <Build> and <Tree><Spec> attributes are needed; read just those
+        build_section, spec = read_build_header(xml_path)
+        build_section = build_section or {}
+        if spec is None:
+            # No single tree to count; report the build as unparsed rather
+            # than as 0 allocated points
+            raise ValueError("Tree has more than one Spec")
 
         # Extract metadata
-        character_class = build_section.get("@className", "Unknown")
-        level = int(build_section.get("@level", 0))
-        ascendancy = build_section.get("@ascendClassName", "None")
+        character_class = build_section.get("className", "Unknown")
+        level = int(build_section.get("level", 0))
+        ascendancy = build_section.get("ascendClassName", "None")
 
         # Extract passive tree nodes
-        tree_section = pob_root.get("Tree", {})
-        spec = tree_section.get("Spec", {})
-        nodes_str = spec.get("@nodes", "")
+        nodes_str = spec.get("nodes", "")
 
-        # Count allocated nodes
+        # Count allocated nodes (non-empty CSV tokens; split/count both run in C)
         allocated_points = 0
         if nodes_str:
-            node_ids = [n.strip() for n in nodes_str.split(",") if n.strip()]
-            allocated_points = len(node_ids)
+            node_ids = nodes_str.split(",")
+            allocated_points = len(node_ids) - node_ids.count("")
 
         # Calculate unallocated points (level-1 total, minus allocated)
         # In PoE2: Level 1 = 0 points, each level gives 1 point
@@ -73,8 +66,8 @@ def extract_build_metadata(xml_path: Path) -> Dict:
             "allocated_points": allocated_points,
             "unallocated_points": unallocated_points,
             "total_points_available": total_points,
-            "build_name": build_section.get("@buildName", ""),
-            "tree_version": build_section.get("@targetVersion", "0_1")
+            "build_name": build_section.get("buildName", ""),
+            "tree_version": build_section.get("targetVersion", "0_1")
         }
 
     except Exception as e:
@@ -98,11 +91,14 @@ def generate_corpus_manifest():
     xml_files = sorted(parity_builds_dir.glob("*.xml"))
     print(f"Found {len(xml_files)} XML build files\n")
 
-    # Extract metadata from each build
+    # Extract metadata from each build; files are independent, so parse them
+    # across processes. map() keeps results in sorted filename order.
     builds = []
-    for xml_file in xml_files:
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(extract_build_metadata, xml_files, chunksize=4))
+
+    for xml_file, metadata in zip(xml_files, results):
         print(f"Processing: {xml_file.name}...")
-        metadata = extract_build_metadata(xml_file)
 
         if metadata:
             # Generate build_id from filename
@@ -161,8 +157,7 @@ def generate_corpus_manifest():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Write manifest
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2)
+    write_json(output_file, manifest)
 
     print(f"\n{'='*60}")
     print(f"Corpus Manifest Generated Successfully!")
@@ -23,12 +23,13 @@ sys.path.insert(0, str(repo_root))
 import json
 import logging
 import random
-import xml.etree.ElementTree as ET
-from typing import Set, Dict, Any, List, Tuple
+from typing import Dict, Any, List
 
 from src.models.build_data import BuildData, CharacterClass
-from src.parsers.xml_utils import parse_xml
 from src.calculator.passive_tree import get_passive_tree
+# Shared with the optimizer's swap moves: one definition of "removable"
+from src.optimizer.neighbor_generator import find_removable_nodes
+from _degrade_common import load_build_from_xml_file, set_spec_nodes
 
 # Configure logging
 logging.basicConfig(
@@ -38,130 +39,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_build_from_xml_file(xml_path: Path) -> Tuple[BuildData, str]:
-    """Load BuildData and raw XML from file.
-
-    Args:
-        xml_path: Path to PoB XML file
-
-    Returns:
-        Tuple of (BuildData, raw_xml_string)
-    """
-    if not xml_path.exists():
-        raise FileNotFoundError(f"Build file not found: {xml_path}")
-
-    # Read raw XML
-    xml_str = xml_path.read_text(encoding='utf-8')
-
-    # Parse to BuildData
-    data = parse_xml(xml_str)
-    pob_root = data.get("PathOfBuilding2") or data.get("PathOfBuilding")
-    if not pob_root:
-        raise ValueError("Missing PathOfBuilding root element")
-
-    build_section = pob_root.get("Build")
-    if not build_section:
-        raise ValueError("Missing Build section")
-
-    # Extract character data
-    class_name = build_section.get("@className")
-    character_class = CharacterClass(class_name) if class_name else CharacterClass.WITCH
-
-    level = int(build_section.get("@level", "90"))
-
-    ascendancy = build_section.get("@ascendClassName")
-    if ascendancy == "None":
-        ascendancy = None
-
-    # Extract passive tree
-    tree_section = pob_root.get("Tree", {})
-    spec = tree_section.get("Spec", {}) if isinstance(tree_section, dict) else {}
-    nodes_str = spec.get("@nodes", "") if isinstance(spec, dict) else ""
-
-    passive_nodes: Set[int] = set()
-    if nodes_str:
-        try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
-        except ValueError:
-            pass
-
-    build_data = BuildData(
-        character_class=character_class,
-        level=level,
-        ascendancy=ascendancy,
-        passive_nodes=passive_nodes,
-        items=[],
-        skills=[],
-        tree_version="0_1"
-    )
-
-    return build_data, xml_str
-
-
-def find_removable_nodes(build: BuildData, tree, class_start: int) -> Set[int]:
-    """Find nodes that can be removed without breaking tree connectivity.
-
-    This implements the same logic as neighbor_generator._find_removable_nodes
-    but as a standalone function for build degradation.
-
-    Args:
-        build: BuildData object
-        tree: PassiveTreeGraph
-        class_start: Class starting node ID
-
-    Returns:
-        Set of removable node IDs
-    """
-    removable = set()
-
-    for node in build.passive_nodes:
-        if node == class_start:
-            continue  # Never remove class start
-
-        # Test: remove node, check if tree stays connected
-        temp_allocated = build.passive_nodes - {node}
-
-        # Check if all nodes still reachable from class_start
-        if _is_tree_valid(tree, temp_allocated, class_start):
-            removable.add(node)
-
-    return removable
-
-
-def _is_tree_valid(tree, allocated_nodes: Set[int], class_start: int) -> bool:
-    """Check if all nodes are connected from class_start.
-
-    Args:
-        tree: PassiveTreeGraph
-        allocated_nodes: Set of allocated node IDs
-        class_start: Class starting node ID
-
-    Returns:
-        True if tree is valid (all nodes reachable from start)
-    """
-    if not allocated_nodes:
-        return True
-
-    if class_start not in allocated_nodes:
-        return False
-
-    # BFS to check connectivity
-    visited = {class_start}
-    queue = [class_start]
-
-    while queue:
-        current = queue.pop(0)
-        neighbors = tree.get_neighbors(current)
-
-        for neighbor in neighbors:
-            if neighbor in allocated_nodes and neighbor not in visited:
-                visited.add(neighbor)
-                queue.append(neighbor)
-
-    # All allocated nodes must be visited
-    return visited == allocated_nodes
-
-
 def degrade_build(
     build: BuildData,
     xml_str: str,
@@ -185,7 +62,7 @@ def degrade_build(
     removable = find_removable_nodes(build, tree, class_start)
 
     if len(removable) < nodes_to_remove:
-        logger.warning(f"Only {len(removable)} removable nodes, requested {nodes_to_remove}")
+        logger.warning("Only %d removable nodes, requested %d", len(removable), nodes_to_remove)
         nodes_to_remove = len(removable)
 
     if nodes_to_remove == 0:
@@ -193,7 +70,8 @@ def degrade_build(
         return xml_str
 
     # Randomly select nodes to remove
-    to_remove = set(random.sample(sorted(removable), nodes_to_remove))
+    # Uniform sampling only needs an indexable sequence, not a sorted one
+    to_remove = set(random.sample(list(removable), nodes_to_remove))
 
     # Create new node set
     new_nodes = build.passive_nodes - to_remove
@@ -201,39 +79,17 @@ def degrade_build(
     # Convert to sorted comma-separated string
     new_nodes_str = ",".join(str(n) for n in sorted(new_nodes))
 
-    # Parse XML and modify
-    root = ET.fromstring(xml_str)
-
-    # Find Tree/Spec element and update nodes attribute
-    for tree_elem in root.findall(".//Tree/Spec"):
-        tree_elem.set("nodes", new_nodes_str)
-
-    # Convert back to string
-    modified_xml = ET.tostring(root, encoding='unicode')
-
-    # Add XML declaration
-    if not modified_xml.startswith('<?xml'):
-        modified_xml = '<?xml version="1.0" encoding="UTF-8"?>\n' + modified_xml
+    # Rewrite the Tree/Spec nodes attribute in place (no parse/re-serialize)
+    modified_xml = set_spec_nodes(xml_str, new_nodes_str)
 
     return modified_xml
 
 
-def get_class_start_node(character_class: CharacterClass, tree) -> int:
-    """Get starting node ID for character class from passive tree.
-
-    Args:
-        character_class: CharacterClass enum
-        tree: PassiveTreeGraph with class_start_nodes
-
-    Returns:
-        Starting node ID
-    """
-    # Get from tree's class_start_nodes dictionary
-    return tree.class_start_nodes.get(character_class.value, 59822)
-
-
 def main():
     """Generate degraded builds from parity builds."""
+    # Set random seed for reproducibility
+    random.seed(42)
+
     # Paths
     parity_dir = repo_root / "tests" / "fixtures" / "parity_builds"
     output_dir = repo_root / "tests" / "fixtures" / "optimization_corpus" / "degraded"
@@ -262,17 +118,23 @@ def main():
     # Vary the difficulty to get a good distribution
     difficulty_cycle = ['HIP', 'MIP', 'LIP']  # Cycle through difficulties
 
+    # Class start node per class, resolved once instead of per build
+    # 59822 is the fallback start node for classes missing from the tree data
+    class_start_by_class = {
+        cls: tree.class_start_nodes.get(cls.value, 59822) for cls in CharacterClass
+    }
+
     for idx, parity_file in enumerate(poeninja_builds):
         try:
-            logger.info(f"\nProcessing: {parity_file.name}")
+            logger.info("\nProcessing: %s", parity_file.name)
 
             # Load build
             build, xml_str = load_build_from_xml_file(parity_file)
 
-            logger.info(f"  Level {build.level}, {len(build.passive_nodes)} nodes allocated")
+            logger.info("  Level %d, %d nodes allocated", build.level, len(build.passive_nodes))
 
             # Get class start node
-            class_start = get_class_start_node(build.character_class, tree)
+            class_start = class_start_by_class[build.character_class]
 
             # Determine difficulty for this build
             difficulty = difficulty_cycle[idx % len(difficulty_cycle)]
@@ -293,7 +155,7 @@ def main():
             output_name = f"{base_name}_degraded_{difficulty.lower()}.xml"
             output_path = output_dir / output_name
 
-            output_path.write_text(degraded_xml, encoding='utf-8')
+            output_path.write_bytes(degraded_xml.encode('utf-8'))
 
             degraded_builds.append({
                 "filename": output_name,
@@ -306,11 +168,11 @@ def main():
                 "class": build.character_class.value
             })
 
-            logger.info(f"  Created {difficulty} build: removed {nodes_to_remove} nodes")
-            logger.info(f"  Saved to: {output_path.name}")
+            logger.info("  Created %s build: removed %d nodes", difficulty, nodes_to_remove)
+            logger.info("  Saved to: %s", output_path.name)
 
         except Exception as e:
-            logger.error(f"  ERROR processing {parity_file.name}: {e}")
+            logger.error("  ERROR processing %s: %s", parity_file.name, e)
             continue
 
     # Save manifest
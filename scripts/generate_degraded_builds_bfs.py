@@ -21,13 +21,12 @@ sys.path.insert(0, str(repo_root))
 import json
 import logging
 import random
-import xml.etree.ElementTree as ET
 from typing import Set, Dict, Any, List, Tuple
 from collections import deque
 
 from src.models.build_data import BuildData, CharacterClass
-from src.parsers.xml_utils import parse_xml
 from src.calculator.passive_tree import get_passive_tree
+from _degrade_common import load_build_from_xml_file, set_spec_nodes
 
 # Configure logging
 logging.basicConfig(
@@ -37,54 +36,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_build_from_xml_file(xml_path: Path) -> Tuple[BuildData, str]:
-    """Load BuildData and raw XML from file."""
-    if not xml_path.exists():
-        raise FileNotFoundError(f"Build file not found: {xml_path}")
-
-    xml_str = xml_path.read_text(encoding='utf-8')
-    data = parse_xml(xml_str)
-    pob_root = data.get("PathOfBuilding2") or data.get("PathOfBuilding")
-    if not pob_root:
-        raise ValueError("Missing PathOfBuilding root element")
-
-    build_section = pob_root.get("Build")
-    if not build_section:
-        raise ValueError("Missing Build section")
-
-    class_name = build_section.get("@className")
-    character_class = CharacterClass(class_name) if class_name else CharacterClass.WITCH
-
-    level = int(build_section.get("@level", "90"))
-
-    ascendancy = build_section.get("@ascendClassName")
-    if ascendancy == "None":
-        ascendancy = None
-
-    tree_section = pob_root.get("Tree", {})
-    spec = tree_section.get("Spec", {}) if isinstance(tree_section, dict) else {}
-    nodes_str = spec.get("@nodes", "") if isinstance(spec, dict) else ""
-
-    passive_nodes: Set[int] = set()
-    if nodes_str:
-        try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
-        except ValueError:
-            pass
-
-    build_data = BuildData(
-        character_class=character_class,
-        level=level,
-        ascendancy=ascendancy,
-        passive_nodes=passive_nodes,
-        items=[],
-        skills=[],
-        tree_version="0_1"
-    )
-
-    return build_data, xml_str
-
-
 def bfs_truncate(nodes: Set[int], class_start: int, target_count: int, tree) -> Set[int]:
     """Use BFS to keep only first N nodes from class start.
 
@@ -101,8 +52,14 @@ def bfs_truncate(nodes: Set[int], class_start: int, target_count: int, tree) ->
         return set()
 
     visited = []
+    # Nodes are marked when discovered, so visited and queue stay disjoint and
+    # nothing is enqueued twice. BFS pops in enqueue order, so only the first
+    # target_count discovered nodes are ever kept; later ones are still marked
+    # (the shuffled neighbor lists, and with them the seeded RNG stream, stay
+    # as before) but not enqueued, which bounds the queue to target_count.
     visited_set = {class_start}
     queue = deque([class_start])
+    neighbors: List[int] = []  # scratch buffer, refilled for each popped node
 
     # BFS traversal
     while queue and len(visited) < target_count:
@@ -110,16 +67,16 @@ def bfs_truncate(nodes: Set[int], class_start: int, target_count: int, tree) ->
         visited.append(current)
 
         # Get neighbors that are in allocated set
-        neighbors = [n for n in tree.get_neighbors(current) if n in nodes and n not in visited_set]
+        neighbors.clear()
+        neighbors.extend(n for n in tree.get_neighbors(current) if n in nodes and n not in visited_set)
 
         # Randomize order to avoid always taking the same path
         random.shuffle(neighbors)
 
         for neighbor in neighbors:
-            if len(visited) >= target_count:
-                break
+            if len(visited) + len(queue) < target_count:
+                queue.append(neighbor)
             visited_set.add(neighbor)
-            queue.append(neighbor)
 
     return set(visited[:target_count])
 
@@ -144,7 +101,7 @@ def degrade_build_bfs(
         Tuple of (modified XML, nodes removed)
     """
     if target_nodes >= len(build.passive_nodes):
-        logger.warning(f"Target {target_nodes} >= current {len(build.passive_nodes)}, no degradation")
+        logger.warning("Target %d >= current %d, no degradation", target_nodes, len(build.passive_nodes))
         return xml_str, 0
 
     if target_nodes < 1:
@@ -162,19 +119,8 @@ def degrade_build_bfs(
     # Convert to sorted comma-separated string
     new_nodes_str = ",".join(str(n) for n in sorted(kept_nodes))
 
-    # Parse XML and modify
-    root = ET.fromstring(xml_str)
-
-    # Find Tree/Spec element and update nodes attribute
-    for tree_elem in root.findall(".//Tree/Spec"):
-        tree_elem.set("nodes", new_nodes_str)
-
-    # Convert back to string
-    modified_xml = ET.tostring(root, encoding='unicode')
-
-    # Add XML declaration
-    if not modified_xml.startswith('<?xml'):
-        modified_xml = '<?xml version="1.0" encoding="UTF-8"?>\n' + modified_xml
+    # Rewrite the Tree/Spec nodes attribute in place (no parse/re-serialize)
+    modified_xml = set_spec_nodes(xml_str, new_nodes_str)
 
     return modified_xml, actual_removed
 
@@ -211,19 +157,22 @@ def main():
 
     difficulty_cycle = ['HIP', 'MIP', 'LIP']
 
+    # Class start node per class, resolved once instead of per build
+    class_start_by_class = {cls: tree.class_start_nodes.get(cls.value) for cls in CharacterClass}
+
     for idx, parity_file in enumerate(poeninja_builds):
         try:
-            logger.info(f"\nProcessing: {parity_file.name}")
+            logger.info("\nProcessing: %s", parity_file.name)
 
             # Load build
             build, xml_str = load_build_from_xml_file(parity_file)
 
-            logger.info(f"  Level {build.level}, {len(build.passive_nodes)} nodes allocated")
+            logger.info("  Level %d, %d nodes allocated", build.level, len(build.passive_nodes))
 
             # Get class start node
-            class_start = tree.class_start_nodes.get(build.character_class.value)
+            class_start = class_start_by_class[build.character_class]
             if class_start is None:
-                logger.error(f"  ERROR: No class start for {build.character_class.value}")
+                logger.error("  ERROR: No class start for %s", build.character_class.value)
                 continue
 
             # Determine difficulty
@@ -250,7 +199,7 @@ def main():
             )
 
             if actual_removed == 0:
-                logger.warning(f"  Skipping - could not degrade")
+                logger.warning("  Skipping - could not degrade")
                 continue
 
             # Save degraded build
@@ -258,7 +207,7 @@ def main():
             output_name = f"{base_name}_degraded_{difficulty.lower()}.xml"
             output_path = output_dir / output_name
 
-            output_path.write_text(degraded_xml, encoding='utf-8')
+            output_path.write_bytes(degraded_xml.encode('utf-8'))
 
             final_node_count = original_count - actual_removed
             unallocated = max(0, build.level - 1 - final_node_count)
@@ -276,12 +225,16 @@ def main():
                 "class": build.character_class.value
             })
 
-            logger.info(f"  Created {difficulty} build: kept {final_node_count}/{original_count} nodes ({actual_removed} removed, {round(actual_removed/original_count*100, 1)}%)")
-            logger.info(f"  ~{unallocated} unallocated points available")
-            logger.info(f"  Saved to: {output_path.name}")
+            logger.info(
+                "  Created %s build: kept %d/%d nodes (%d removed, %s%%)",
+                difficulty, final_node_count, original_count, actual_removed,
+                round(actual_removed / original_count * 100, 1)
+            )
+            logger.info("  ~%d unallocated points available", unallocated)
+            logger.info("  Saved to: %s", output_path.name)
 
         except Exception as e:
-            logger.error(f"  ERROR processing {parity_file.name}: {e}")
+            logger.error("  ERROR processing %s: %s", parity_file.name, e)
             import traceback
             traceback.print_exc()
             continue
@@ -19,15 +19,15 @@ from pathlib import Path
 repo_root = Path(__file__).parent.parent
 sys.path.insert(0, str(repo_root))
 
-import json
 import logging
 import random
-import xml.etree.ElementTree as ET
 from typing import Set, Dict, Any, List, Tuple
+from collections import deque
 
 from src.models.build_data import BuildData, CharacterClass
-from src.parsers.xml_utils import parse_xml
 from src.calculator.passive_tree import get_passive_tree
+from _degrade_common import load_build_from_xml_file, set_spec_nodes
+from _json_io import write_json
 
 # Configure logging
 logging.basicConfig(
@@ -37,54 +37,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_build_from_xml_file(xml_path: Path) -> Tuple[BuildData, str]:
-    """Load BuildData and raw XML from file."""
-    if not xml_path.exists():
-        raise FileNotFoundError(f"Build file not found: {xml_path}")
-
-    xml_str = xml_path.read_text(encoding='utf-8')
-    data = parse_xml(xml_str)
-    pob_root = data.get("PathOfBuilding2") or data.get("PathOfBuilding")
-    if not pob_root:
-        raise ValueError("Missing PathOfBuilding root element")
-
-    build_section = pob_root.get("Build")
-    if not build_section:
-        raise ValueError("Missing Build section")
-
-    class_name = build_section.get("@className")
-    character_class = CharacterClass(class_name) if class_name else CharacterClass.WITCH
-
-    level = int(build_section.get("@level", "90"))
-
-    ascendancy = build_section.get("@ascendClassName")
-    if ascendancy == "None":
-        ascendancy = None
-
-    tree_section = pob_root.get("Tree", {})
-    spec = tree_section.get("Spec", {}) if isinstance(tree_section, dict) else {}
-    nodes_str = spec.get("@nodes", "") if isinstance(spec, dict) else ""
-
-    passive_nodes: Set[int] = set()
-    if nodes_str:
-        try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
-        except ValueError:
-            pass
-
-    build_data = BuildData(
-        character_class=character_class,
-        level=level,
-        ascendancy=ascendancy,
-        passive_nodes=passive_nodes,
-        items=[],
-        skills=[],
-        tree_version="0_1"
-    )
-
-    return build_data, xml_str
-
-
 def get_connected_component(nodes: Set[int], class_start: int, tree) -> Set[int]:
     """Get all nodes connected to class_start via BFS.
 
@@ -100,10 +52,10 @@ def get_connected_component(nodes: Set[int], class_start: int, tree) -> Set[int]
         return set()
 
     visited = {class_start}
-    queue = [class_start]
+    queue = deque((class_start,))
 
     while queue:
-        current = queue.pop(0)
+        current = queue.popleft()
         neighbors = tree.get_neighbors(current)
 
         for neighbor in neighbors:
@@ -143,8 +95,12 @@ def degrade_build_simple(
         logger.warning("No nodes to remove")
         return xml_str, 0
 
-    # Randomly remove N nodes
-    to_remove = set(random.sample(sorted(removable_nodes), nodes_to_remove))
+    # Randomly remove N nodes (Floyd's sampling: O(k) draws, no sort of the pool)
+    pool = list(removable_nodes)
+    to_remove = set()
+    for j in range(len(pool) - nodes_to_remove, len(pool)):
+        candidate = pool[random.randrange(j + 1)]
+        to_remove.add(candidate if candidate not in to_remove else pool[j])
 
     # Keep remaining nodes
     remaining = build.passive_nodes - to_remove
@@ -160,19 +116,8 @@ def degrade_build_simple(
     # Convert to sorted comma-separated string
     new_nodes_str = ",".join(str(n) for n in sorted(final_nodes))
 
-    # Parse XML and modify
-    root = ET.fromstring(xml_str)
-
-    # Find Tree/Spec element and update nodes attribute
-    for tree_elem in root.findall(".//Tree/Spec"):
-        tree_elem.set("nodes", new_nodes_str)
-
-    # Convert back to string
-    modified_xml = ET.tostring(root, encoding='unicode')
-
-    # Add XML declaration
-    if not modified_xml.startswith('<?xml'):
-        modified_xml = '<?xml version="1.0" encoding="UTF-8"?>\n' + modified_xml
+    # Rewrite the Tree/Spec nodes attribute in place (no parse/re-serialize)
+    modified_xml = set_spec_nodes(xml_str, new_nodes_str)
 
     return modified_xml, actual_removed
 
@@ -205,19 +150,22 @@ def main():
     # Degradation strategy - cycle through difficulties
     difficulty_cycle = ['HIP', 'MIP', 'LIP']
 
+    # Class start node per class, resolved once instead of per build
+    class_start_by_class = {cls: tree.class_start_nodes.get(cls.value) for cls in CharacterClass}
+
     for idx, parity_file in enumerate(poeninja_builds):
         try:
-            logger.info(f"\nProcessing: {parity_file.name}")
+            logger.info("\nProcessing: %s", parity_file.name)
 
             # Load build
             build, xml_str = load_build_from_xml_file(parity_file)
 
-            logger.info(f"  Level {build.level}, {len(build.passive_nodes)} nodes allocated")
+            logger.info("  Level %d, %d nodes allocated", build.level, len(build.passive_nodes))
 
             # Get class start node
-            class_start = tree.class_start_nodes.get(build.character_class.value)
+            class_start = class_start_by_class[build.character_class]
             if class_start is None:
-                logger.error(f"  ERROR: No class start for {build.character_class.value}")
+                logger.error("  ERROR: No class start for %s", build.character_class.value)
                 continue
 
             # Determine difficulty
@@ -237,7 +185,7 @@ def main():
             )
 
             if actual_removed == 0:
-                logger.warning(f"  Skipping - could not remove any nodes")
+                logger.warning("  Skipping - could not remove any nodes")
                 continue
 
             # Save degraded build
@@ -245,7 +193,7 @@ def main():
             output_name = f"{base_name}_degraded_{difficulty.lower()}.xml"
             output_path = output_dir / output_name
 
-            output_path.write_text(degraded_xml, encoding='utf-8')
+            output_path.write_bytes(degraded_xml.encode('utf-8'))
 
             final_node_count = len(build.passive_nodes) - actual_removed
             unallocated = max(0, build.level - 1 - final_node_count)
@@ -262,12 +210,12 @@ def main():
                 "class": build.character_class.value
             })
 
-            logger.info(f"  Created {difficulty} build: removed {actual_removed} nodes")
-            logger.info(f"  Result: {final_node_count} nodes, ~{unallocated} unallocated points")
-            logger.info(f"  Saved to: {output_path.name}")
+            logger.info("  Created %s build: removed %d nodes", difficulty, actual_removed)
+            logger.info("  Result: %d nodes, ~%d unallocated points", final_node_count, unallocated)
+            logger.info("  Saved to: %s", output_path.name)
 
         except Exception as e:
-            logger.error(f"  ERROR processing {parity_file.name}: {e}")
+            logger.error("  ERROR processing %s: %s", parity_file.name, e)
             import traceback
             traceback.print_exc()
             continue
@@ -288,7 +236,7 @@ def main():
     }
 
     manifest_path = output_dir / "degraded_manifest.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    write_json(manifest_path, manifest)
 
     logger.info(f"\n{'='*60}")
     logger.info(f"SUCCESS: Generated {len(degraded_builds)} degraded builds")
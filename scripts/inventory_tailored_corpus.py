@@ -16,40 +16,34 @@ sys.path.insert(0, str(repo_root))
 
 import json
 from typing import Dict, List
-from src.parsers.xml_utils import parse_xml
 from src.models.build_data import BuildData, CharacterClass
+from src.parsers.pob_parser import parse_node_ids
+from _build_header import read_build_header
 
 def load_build_from_xml_file(xml_path: Path) -> BuildData:
-    """Load BuildData from XML file"""
-    xml_str = xml_path.read_text(encoding='utf-8')
-    data = parse_xml(xml_str)
+    """Load BuildData from XML file
 
-    pob_root = data.get("PathOfBuilding2") or data.get("PathOfBuilding")
-    if not pob_root:
-        raise ValueError("Missing PathOfBuilding root element")
-
-    build_section = pob_root.get("Build")
-    if not build_section:
+    Only the <Build> and <Tree><Spec> attributes are read (see
+    _build_header); the inventory never looks at items or skills.
+    """
+    build_section, spec = read_build_header(xml_path)
+    if build_section is None:
         raise ValueError("Missing Build section")
 
-    class_name = build_section.get("@className")
+    class_name = build_section.get("className")
     character_class = CharacterClass(class_name) if class_name else CharacterClass.WITCH
 
-    level = int(build_section.get("@level", "90"))
-    ascendancy = build_section.get("@ascendClassName")
+    level = int(build_section.get("level", "90"))
+    ascendancy = build_section.get("ascendClassName")
     if ascendancy == "None":
         ascendancy = None
 
-    tree_section = pob_root.get("Tree", {})
-    spec = tree_section.get("Spec", {}) if isinstance(tree_section, dict) else {}
-    nodes_str = spec.get("@nodes", "") if isinstance(spec, dict) else ""
+    nodes_str = spec.get("nodes", "")
 
-    passive_nodes = set()
-    if nodes_str:
-        try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
-        except ValueError:
-            pass
+    try:
+        passive_nodes = parse_node_ids(nodes_str)
+    except ValueError:
+        passive_nodes = set()
 
     return BuildData(
         character_class=character_class,
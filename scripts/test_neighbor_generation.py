@@ -12,6 +12,7 @@ from src.models.build_data import BuildData, CharacterClass
 from src.models.optimization_config import OptimizationConfiguration
 from src.optimizer.hill_climbing import optimize_build
 from src.parsers.xml_utils import parse_xml
+from src.parsers.pob_parser import parse_node_ids
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -41,12 +42,10 @@ def load_build_from_xml_file(xml_path: Path) -> BuildData:
     spec = tree_section.get("Spec", {}) if isinstance(tree_section, dict) else {}
     nodes_str = spec.get("@nodes", "") if isinstance(spec, dict) else ""
 
-    passive_nodes = set()
-    if nodes_str:
-        try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
-        except ValueError:
-            pass
+    try:
+        passive_nodes = parse_node_ids(nodes_str)
+    except ValueError:
+        passive_nodes = set()
 
     return BuildData(
         character_class=character_class,
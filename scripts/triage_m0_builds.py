@@ -32,6 +32,7 @@ _ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(_ROOT))
 
 from src.parsers.pob_parser import _extract_passive_nodes  # the BUGGY one (evidence)
+from src.parsers.pob_parser import parse_node_ids
 from src.parsers.xml_utils import parse_xml
 from src.calculator.passive_tree import load_passive_tree
 
@@ -74,7 +75,7 @@ def _correct_nodes(pob_root: dict) -> set[int]:
     else:
         return set()
     nodes_str = target.get("@nodes", "") if isinstance(target, dict) else ""
-    return {int(x) for x in nodes_str.split(",") if x.strip()}
+    return parse_node_ids(nodes_str)
 
 
 def _class_name(pob_root: dict) -> str:
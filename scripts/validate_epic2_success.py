@@ -44,6 +44,7 @@ from src.models.build_data import BuildData, CharacterClass
 from src.models.optimization_config import OptimizationConfiguration, OptimizationResult
 from src.optimizer.hill_climbing import optimize_build
 from src.parsers.xml_utils import parse_xml
+from src.parsers.pob_parser import parse_node_ids
 
 # Configure logging
 logging.basicConfig(
@@ -127,12 +128,10 @@ def load_build_from_xml_file(xml_path: Path) -> BuildData:
     spec = tree_section.get("Spec", {}) if isinstance(tree_section, dict) else {}
     nodes_str = spec.get("@nodes", "") if isinstance(spec, dict) else ""
 
-    passive_nodes = set()
-    if nodes_str:
-        try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
-        except ValueError:
-            pass
+    try:
+        passive_nodes = parse_node_ids(nodes_str)
+    except ValueError:
+        passive_nodes = set()
 
     return BuildData(
         character_class=character_class,
@@ -67,12 +67,11 @@ def load_build_from_xml_file(xml_path: Path) -> tuple[BuildData, Dict[str, Any]]
     spec = tree_section.get("Spec", {}) if isinstance(tree_section, dict) else {}
     nodes_str = spec.get("@nodes", "") if isinstance(spec, dict) else ""
 
-    passive_nodes: Set[int] = set()
-    if nodes_str:
-        try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
-        except ValueError:
-            pass
+    passive_nodes: Set[int]
+    try:
+        passive_nodes = pob_parser.parse_node_ids(nodes_str)
+    except ValueError:
+        passive_nodes = set()
 
     # Extract pre-calculated PlayerStats from XML
     pre_calc_stats = {}
@@ -283,11 +282,11 @@ def main():
         nodes_added_list = [r["nodes_added"] for r in successful]
 
         # Success = builds that allocated nodes (regardless of DPS change due to calculator limitation)
-        builds_with_allocations = len([r for r in successful if r["nodes_added"] > 0])
+        builds_with_allocations = sum(1 for r in successful if r["nodes_added"] > 0)
         allocation_success_rate = builds_with_allocations / len(successful) * 100 if successful else 0
 
         # Traditional DPS-based success rate (will be 0% due to calculator not using items/skills)
-        dps_success_rate = len([r for r in successful if r["improvement_pct"] > 0]) / len(successful) * 100
+        dps_success_rate = sum(1 for r in successful if r["improvement_pct"] > 0) / len(successful) * 100
         median_improvement = median(improvements) if improvements else 0
         max_time = max(times) if times else 0
         total_nodes_allocated = sum(nodes_added_list)
@@ -303,8 +302,8 @@ def main():
         mana_changes = [r["mana_change"] for r in successful if r["mana_change"] != 0]
         total_life_gained = sum(r["life_change"] for r in successful)
         total_mana_gained = sum(r["mana_change"] for r in successful)
-        builds_with_life_gain = len([r for r in successful if r["life_change"] > 0])
-        builds_with_mana_gain = len([r for r in successful if r["mana_change"] > 0])
+        builds_with_life_gain = sum(1 for r in successful if r["life_change"] > 0)
+        builds_with_mana_gain = sum(1 for r in successful if r["mana_change"] > 0)
 
         print(f"\nStat Changes (PROOF optimizer allocates meaningful nodes):")
         print(f"  Builds with Life increase: {builds_with_life_gain}/{len(successful)}")
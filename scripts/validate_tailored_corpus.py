@@ -23,6 +23,7 @@ from dataclasses import dataclass
 from src.models.build_data import BuildData, CharacterClass
 from src.models.optimization_config import OptimizationConfiguration, OptimizationResult
 from src.optimizer.hill_climbing import optimize_build
+from src.parsers.pob_parser import parse_node_ids
 from src.parsers.xml_utils import parse_xml
 
 # Configure logging
@@ -104,7 +105,7 @@ def load_build_from_xml_file(xml_path: Path) -> BuildData:
     passive_nodes = set()
     if nodes_str:
         try:
-            passive_nodes = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
+            passive_nodes = parse_node_ids(nodes_str)
         except ValueError:
             pass
 
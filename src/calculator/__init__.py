@@ -36,6 +36,8 @@ __version__ = "0.3.0"
 __all__ = [
     "PoBCalculationEngine",
     "calculate_build_stats",
+    "prepare_calc_env",
+    "calc_with_env",
     "get_pob_engine",
     "CalculationError",
     "CalculationTimeout",
@@ -65,7 +67,12 @@ from .passive_tree import (
 # Import other modules with graceful failure handling
 try:
     from .pob_engine import PoBCalculationEngine
-    from .build_calculator import calculate_build_stats, get_pob_engine
+    from .build_calculator import (
+        calculate_build_stats,
+        calc_with_env,
+        get_pob_engine,
+        prepare_calc_env,
+    )
     from .exceptions import CalculationError, CalculationTimeout
     from .stub_functions import (
         Deflate,
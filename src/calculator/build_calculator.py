@@ -30,7 +30,8 @@ References:
 
 import logging
 import threading
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Optional
 
 from ..models.build_data import BuildData
 from ..models.build_stats import BuildStats
@@ -155,6 +156,38 @@ def calculate_build_stats(build: BuildData, *, engine: str = "auto") -> BuildSta
     if engine != "auto":
         raise ValueError(f"engine must be 'auto' or 'full', got {engine!r}")
 
+    return calc_with_env(prepare_calc_env(build))
+
+
+@dataclass
+class CalcEnv:
+    """Per-build calculation state produced by prepare_calc_env().
+
+    Holds the hybrid routing decision and, for the MinimalCalc path, the
+    converted Lua ``buildData`` table so repeated evaluations of the same
+    build skip the BuildData -> Lua conversion. The Lua table belongs to the
+    calling thread's engine; use an env only on the thread that created it,
+    and re-prepare after mutating the build.
+    """
+    build: BuildData
+    use_minimalcalc: bool
+    lua_build_data: Optional[Any] = None
+
+
+def prepare_calc_env(build: BuildData) -> CalcEnv:
+    """
+    Do the per-build setup of calculate_build_stats() once.
+
+    Resolves the MinimalCalc / Subprocess routing (AC-2.9.1.7) and converts
+    the build to its Lua table for the MinimalCalc path; a failed conversion
+    is left for calc_with_env() so the Subprocess fallback still applies.
+    Pair with calc_with_env() when the same build is evaluated many times,
+    e.g. measure_batch_perf.py:
+
+        >>> env = prepare_calc_env(build)
+        >>> for _ in range(1000):
+        ...     stats = calc_with_env(env)
+    """
     logger.debug(
         "Calculating stats for build: %s level %d, %d passive nodes",
         build.character_class.value,
@@ -162,9 +195,7 @@ def calculate_build_stats(build: BuildData, *, engine: str = "auto") -> BuildSta
         len(build.passive_nodes)
     )
 
-    # Get thread-local calculator instances
     engine = get_pob_engine()
-    subprocess_calc = get_subprocess_calculator()
 
     # Determine calculation path based on skill type
     # Story 2.9.1 Task 6.2: Routing logic
@@ -189,12 +220,42 @@ def calculate_build_stats(build: BuildData, *, engine: str = "auto") -> BuildSta
         use_minimalcalc = True
         logger.debug("No skills configured, using MinimalCalc")
 
+    env = CalcEnv(build=build, use_minimalcalc=use_minimalcalc)
+    if use_minimalcalc:
+        try:
+            env.lua_build_data = engine.prepare(build)
+        except CalculationError as e:
+            # Leave unprepared; calc_with_env() retries and falls back
+            logger.debug("Deferring MinimalCalc preparation failure: %s", e)
+    return env
+
+
+def calc_with_env(env: CalcEnv) -> BuildStats:
+    """
+    Calculate stats for a build prepared by prepare_calc_env().
+
+    Same results, fallback and error semantics as calculate_build_stats()
+    with engine="auto"; only the per-build setup is skipped.
+
+    Raises:
+        CalculationError: If PoB engine fails (Lua error, invalid build)
+        CalculationTimeout: If calculation exceeds timeout
+    """
+    build = env.build
+    use_minimalcalc = env.use_minimalcalc
+
+    # Get thread-local calculator instances
+    engine = get_pob_engine()
+    subprocess_calc = get_subprocess_calculator()
+
     try:
         if use_minimalcalc:
             # Fast path: Attack skills with MinimalCalc
             # Story 2.9.1 Task 6.2: Attack → MinimalCalc
             logger.debug("Using MinimalCalc (fast path)")
-            stats = engine.calculate(build)
+            if env.lua_build_data is None:
+                env.lua_build_data = engine.prepare(build)
+            stats = engine.calculate_prepared(env.lua_build_data)
         else:
             # Subprocess path: Spell/DOT/totem skills
             # Story 2.9.1 Task 6.2: Spell/DOT/totem → Subprocess
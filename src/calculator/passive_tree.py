@@ -12,9 +12,10 @@ Date: 2025-10-20
 import json
 import logging
 import os
+import pickle
 import sys
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -24,6 +25,15 @@ logger = logging.getLogger(__name__)
 # Module-level cache for singleton pattern
 _PASSIVE_TREE_CACHE: Optional['PassiveTreeGraph'] = None
 
+# On-disk cache of built graphs, so every new process (e.g. the per-build
+# validation subprocesses) skips the tree.json parse. Entries hold plain
+# dicts/tuples only (no pickled classes), so they load the same whether this
+# module is imported as src.calculator.passive_tree or calculator.passive_tree.
+# PassiveNode field changes invalidate entries automatically; bump the format
+# when the loader's output otherwise changes for the same tree.json.
+TREE_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / ".cache" / "passive_tree"
+_TREE_CACHE_FORMAT = 1
+
 
 @dataclass
 class PassiveNode:
@@ -245,6 +255,8 @@ def load_passive_tree(tree_version: str = "0_3") -> PassiveTreeGraph:
 
     Loads tree data from external/pob-engine/src/TreeData/{version}/tree.json
     and constructs a PassiveTreeGraph with nodes, edges, and class starting positions.
+    The built graph is pickled under .cache/passive_tree/ and reused while
+    tree.json keeps the same mtime and size.
 
     Args:
         tree_version: Tree data version to load (default: "0_3" for latest PoE 2)
@@ -273,6 +285,67 @@ def load_passive_tree(tree_version: str = "0_3") -> PassiveTreeGraph:
             "Ensure the pob-engine submodule is initialized: git submodule update --init"
         )
 
+    return _load_tree_file(tree_file, tree_version)
+
+
+def _load_tree_file(
+    tree_file: Path,
+    tree_version: str,
+    cache_dir: Path = TREE_CACHE_DIR
+) -> PassiveTreeGraph:
+    """
+    Build the graph for tree_file, going through the on-disk pickle cache.
+
+    A cache entry is used only when its (format, mtime_ns, size) stamp still
+    matches; unreadable or stale entries are rebuilt. Writing the cache is
+    best-effort and never fails the load.
+    """
+    node_fields = tuple(f.name for f in fields(PassiveNode))
+    st = tree_file.stat()
+    stamp = (_TREE_CACHE_FORMAT, node_fields, st.st_mtime_ns, st.st_size)
+    cache_file = cache_dir / f"{tree_version}.pkl"
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            tree = PassiveTreeGraph(
+                nodes={node_id: PassiveNode(*values) for node_id, values in data["nodes"].items()},
+                edges=data["edges"],
+                class_start_nodes=data["class_start_nodes"],
+                tree_version=tree_version
+            )
+            logger.info(f"Loaded passive tree from cache: {cache_file}")
+            return tree
+    except Exception as e:
+        # Any unreadable/foreign entry is just a cache miss
+        logger.debug(f"Ignoring passive tree cache {cache_file}: {e}")
+
+    tree = _build_passive_tree(tree_file, tree_version)
+
+    data = {
+        "nodes": {
+            node_id: tuple(getattr(node, name) for name in node_fields)
+            for node_id, node in tree.nodes.items()
+        },
+        "edges": tree.edges,
+        "class_start_nodes": tree.class_start_nodes,
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Per-process temp name + atomic rename: parallel workers may race here
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write passive tree cache {cache_file}: {e}")
+
+    return tree
+
+
+def _build_passive_tree(tree_file: Path, tree_version: str) -> PassiveTreeGraph:
+    """Parse tree.json and construct the PassiveTreeGraph (no caching)."""
     logger.info(f"Loading passive tree data from: {tree_file}")
 
     # Load JSON data
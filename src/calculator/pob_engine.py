@@ -268,6 +268,10 @@ class PoBCalculationEngine:
             - Task 5: Extract results from Lua
             - Task 6: Error handling and timeout
 
+        Convenience wrapper for ``calculate_prepared(prepare(build))``. Callers
+        that evaluate the same build repeatedly (benchmarks, re-scoring) should
+        call prepare() once and calculate_prepared() in the loop instead.
+
         Args:
             build: BuildData object containing character, tree, items, skills
 
@@ -290,14 +294,45 @@ class PoBCalculationEngine:
             - Tech Spec Epic 1: Lines 318-353 (Calculator API)
             - Story 1.5 Tasks 4, 5, 6
         """
-        import signal
-        import time
-        from ..models.build_stats import BuildStats
+        return self.calculate_prepared(self.prepare(build))
+
+    def _dict_to_lua_table(self, d):
+        """Recursively convert a nested dict (and its lists) to Lua tables."""
+        # Story 2.9 Fix: Also convert Python lists to Lua tables for proper iteration
+        if not isinstance(d, dict):
+            return d
+        lua_tbl = self._lua.table()
+        for k, v in d.items():
+            if isinstance(v, dict):
+                lua_tbl[k] = self._dict_to_lua_table(v)
+            elif isinstance(v, list):
+                # Convert Python list to Lua table (1-indexed array)
+                # This is critical for stats parsing in MinimalCalc.lua
+                converted_list = [self._dict_to_lua_table(item) if isinstance(item, dict) else item for item in v]
+                lua_tbl[k] = self._lua.table_from(converted_list)
+            else:
+                lua_tbl[k] = v
+        return lua_tbl
+
+    def prepare(self, build: 'BuildData'):  # type: ignore
+        """
+        Convert BuildData to the Lua ``buildData`` table (Story 1.5 Task 4).
+
+        Everything MinimalCalc.lua only reads (class, level, passive nodes,
+        config, skills, items) is converted here once. The passive tree is
+        NOT included: Calculate() mutates it, so calculate_prepared() attaches
+        a fresh copy on every call.
+
+        The returned table belongs to this engine's LuaRuntime and must only
+        be passed back to calculate_prepared() on the same (thread-local)
+        engine.
 
+        Raises:
+            CalculationError: If the build cannot be converted
+        """
         # Ensure Lua runtime initialized
         self._ensure_initialized()
 
-        # Task 4: Convert BuildData to Lua table
         # Simplified approach: pass structured data directly to Lua
         # (avoiding XML parsing complexity in Lua)
         try:
@@ -316,39 +351,6 @@ class PoBCalculationEngine:
                 len(passive_nodes_python_list)
             )
 
-            # Story 1.8 Task 3: Use pre-converted passive tree dict (cached at init)
-            # This was the PRIMARY bottleneck - 69.5% of runtime (11.39ms per call)
-            # Cache dict, convert to FRESH Lua table each time (avoids mutation issues)
-            # Expected savings: ~11.4 seconds for batch 1000 calculations
-
-            # Construct Lua table for buildData parameter
-            # MinimalCalc.lua Calculate() expects:
-            #   - characterClass: string
-            #   - level: number
-            #   - passiveNodes: table/array of node IDs
-            #   - treeData: PassiveTree structure from Story 1.7 (REQUIRED for calcs.initEnv)
-            # Recursively convert nested config dict to Lua tables
-            # Story 2.9 Fix: Also convert Python lists to Lua tables for proper iteration
-            def dict_to_lua_table(d):
-                if not isinstance(d, dict):
-                    return d
-                lua_tbl = self._lua.table()
-                for k, v in d.items():
-                    if isinstance(v, dict):
-                        lua_tbl[k] = dict_to_lua_table(v)
-                    elif isinstance(v, list):
-                        # Convert Python list to Lua table (1-indexed array)
-                        # This is critical for stats parsing in MinimalCalc.lua
-                        converted_list = [dict_to_lua_table(item) if isinstance(item, dict) else item for item in v]
-                        lua_tbl[k] = self._lua.table_from(converted_list)
-                    else:
-                        lua_tbl[k] = v
-                return lua_tbl
-
-            # Story 1.8 Task 3: Convert cached dict to fresh Lua table (avoids mutation)
-            # Use dict_to_lua_table() for recursive conversion (handles nested node dicts)
-            tree_data_lua_table = dict_to_lua_table(self._tree_data_lua)
-
             # Story 2.9 Phase 2: Convert skills to Lua table format
             # Each skill becomes a socket group with active skill and supports
             skills_lua = self._lua.table()
@@ -406,17 +408,53 @@ class PoBCalculationEngine:
                 len(build.items)
             )
 
-            lua_build_data = self._lua.table(
+            # Construct Lua table for buildData parameter
+            # MinimalCalc.lua Calculate() expects:
+            #   - characterClass: string
+            #   - level: number
+            #   - passiveNodes: table/array of node IDs
+            #   - treeData: PassiveTree structure from Story 1.7 (REQUIRED for calcs.initEnv)
+            #     (attached per call by calculate_prepared)
+            return self._lua.table(
                 characterClass=character_class_str,
                 level=build.level,
                 passiveNodes=passive_nodes_list,
-                treeData=tree_data_lua_table,  # Story 1.8 Task 3: Fresh Lua table from cached dict
-                config=dict_to_lua_table(build.config),  # Enemy/calculation configuration from PoB
+                config=self._dict_to_lua_table(build.config),  # Enemy/calculation configuration from PoB
                 skills=skills_lua,  # Story 2.9 Phase 2: Active skills and supports
                 items=items_lua,  # Story 2.9 Milestone 2: Equipment items with weapon stats
                 mainSocketGroup=build.main_socket_group  # Story 2.9.2: Main skill selection
             )
 
+        except Exception as e:
+            logger.error("Unexpected error in prepare(): %s", e, exc_info=True)
+            raise CalculationError(
+                f"Unexpected calculation error: {str(e)}"
+            ) from e
+
+    def calculate_prepared(self, lua_build_data) -> 'BuildStats':  # type: ignore
+        """
+        Run MinimalCalc.lua Calculate() on a table returned by prepare().
+
+        Story 1.5 Tasks 5 and 6: extracts results into BuildStats and applies
+        the 5-second timeout check. Only the passive tree is re-converted per
+        call; the rest of the build table is reused as-is.
+
+        Raises:
+            CalculationError: If Lua calculation fails
+            CalculationTimeout: If calculation exceeds 5 seconds
+        """
+        import time
+        from ..models.build_stats import BuildStats
+
+        self._ensure_initialized()
+
+        try:
+            # Story 1.8 Task 3: Use pre-converted passive tree dict (cached at init)
+            # This was the PRIMARY bottleneck - 69.5% of runtime (11.39ms per call)
+            # Cache dict, convert to FRESH Lua table each time (avoids mutation issues)
+            # Expected savings: ~11.4 seconds for batch 1000 calculations
+            lua_build_data["treeData"] = self._dict_to_lua_table(self._tree_data_lua)
+
             # Task 6: Implement 5-second timeout
             # Note: signal.alarm() only works on Unix. For cross-platform,
             # we'll use a simple time-based check with a fallback.
@@ -532,7 +570,7 @@ class PoBCalculationEngine:
             raise
         except Exception as e:
             # Wrap unexpected errors
-            logger.error("Unexpected error in calculate(): %s", e, exc_info=True)
+            logger.error("Unexpected error in calculate_prepared(): %s", e, exc_info=True)
             raise CalculationError(
                 f"Unexpected calculation error: {str(e)}"
             ) from e
@@ -24,7 +24,7 @@ References:
 
 import logging
 import time
-from typing import List, Tuple, Optional, Callable
+from typing import Dict, FrozenSet, List, Tuple, Optional, Callable
 from dataclasses import replace
 
 from src.models.build_data import BuildData
@@ -155,6 +155,15 @@ def optimize_build(config: OptimizationConfiguration) -> OptimizationResult:
         0.001
     )
 
+    # Per-run stats memo keyed on the allocated node set. Within one run only
+    # passive_nodes varies between neighbors (main skill is resolved up front and
+    # items/skills/config are shared via dataclasses.replace), so a swap that
+    # undoes an earlier move, or a neighbor re-generated next iteration, reuses
+    # its stats instead of paying another PoB calculation.
+    stats_cache: Dict[FrozenSet[int], BuildStats] = {
+        frozenset(config.build.passive_nodes): baseline_stats
+    }
+
     # Progress tracking (Story 2.8: ProgressTracker integration)
     progress_tracker = ProgressTracker(callback=config.progress_callback)
     baseline_metric = _get_metric_value(baseline_stats, config.metric)
@@ -220,6 +229,7 @@ def optimize_build(config: OptimizationConfiguration) -> OptimizationResult:
             config.metric,
             current_stats,
             cancel_check=config.cancel_check,
+            stats_cache=stats_cache,
         )
 
         # ========================================
@@ -453,6 +463,7 @@ def _evaluate_neighbors(
     metric: str,
     baseline_stats: BuildStats,
     cancel_check: Optional[Callable[[], bool]] = None,
+    stats_cache: Optional[Dict[FrozenSet[int], BuildStats]] = None,
 ) -> List[Tuple[BuildData, BuildStats]]:
     """
     Evaluate all neighbor configurations using PoB calculations (AC #3).
@@ -464,6 +475,9 @@ def _evaluate_neighbors(
         neighbors: List of neighbor BuildData configurations
         metric: Optimization metric ("dps", "ehp", "balanced")
         baseline_stats: Baseline stats for comparison
+        stats_cache: Optional memo of stats keyed by frozenset(passive_nodes);
+            hits skip the PoB calculation and successful misses are stored.
+            Only valid while every other BuildData field is held fixed.
 
     Returns:
         List of (build, stats) tuples for neighbors that calculated successfully
@@ -485,9 +499,17 @@ def _evaluate_neighbors(
                 len(evaluations), len(neighbors),
             )
             break
+        if stats_cache is not None:
+            key = frozenset(neighbor.passive_nodes)
+            cached = stats_cache.get(key)
+            if cached is not None:
+                evaluations.append((neighbor, cached))
+                continue
         try:
             stats = calculate_build_stats(neighbor)
             evaluations.append((neighbor, stats))
+            if stats_cache is not None:
+                stats_cache[key] = stats
 
         except Exception as e:
             # Log error and skip this neighbor
@@ -525,8 +547,10 @@ def _select_best_neighbor(
     if not evaluations:
         return None
 
-    # Find best neighbor by metric value
-    best_idx = max(range(len(evaluations)), key=lambda i: _get_metric_value(evaluations[i][1], metric))
+    # Find best neighbor by metric value. Resolve the metric extractor once
+    # instead of re-dispatching on the metric string for every neighbor.
+    extract = _metric_extractor(metric)
+    best_idx = max(range(len(evaluations)), key=lambda i: extract(evaluations[i][1]))
     best_build, best_stats = evaluations[best_idx]
 
     # Extract node changes from corresponding mutation
@@ -537,6 +561,35 @@ def _select_best_neighbor(
     return (best_build, best_stats, nodes_added, nodes_removed)
 
 
+# Metric extractors keyed by optimization metric (higher is better).
+# Simplified balanced metric (Story 2.6 will implement proper normalization).
+# Tech spec: 60% DPS, 40% EHP weighting
+_METRIC_EXTRACTORS = {
+    "dps": lambda stats: stats.total_dps,
+    "ehp": lambda stats: stats.effective_hp,
+    "balanced": lambda stats: stats.total_dps * 0.6 + stats.effective_hp * 0.4,
+}
+
+
+def _metric_extractor(metric: str) -> Callable[[BuildStats], float]:
+    """
+    Resolve the metric extractor for an optimization metric.
+
+    Args:
+        metric: Optimization metric ("dps", "ehp", "balanced")
+
+    Returns:
+        Callable mapping BuildStats to the metric value
+
+    Raises:
+        ValueError: If metric is unknown
+    """
+    try:
+        return _METRIC_EXTRACTORS[metric]
+    except KeyError:
+        raise ValueError(f"Unknown metric: {metric}") from None
+
+
 def _get_metric_value(stats: BuildStats, metric: str) -> float:
     """
     Extract metric value from BuildStats (simplified for Story 2.1).
@@ -556,16 +609,7 @@ def _get_metric_value(stats: BuildStats, metric: str) -> float:
     References:
         - Story 2.6: Metric selection and evaluation
     """
-    if metric == "dps":
-        return stats.total_dps
-    elif metric == "ehp":
-        return stats.effective_hp
-    elif metric == "balanced":
-        # Simplified balanced metric (Story 2.6 will implement proper normalization)
-        # Tech spec: 60% DPS, 40% EHP weighting
-        return stats.total_dps * 0.6 + stats.effective_hp * 0.4
-    else:
-        raise ValueError(f"Unknown metric: {metric}")
+    return _metric_extractor(metric)(stats)
 
 
 def _calculate_improvement_percentage(
@@ -20,8 +20,9 @@ References:
 """
 
 import logging
+from collections import deque
 from dataclasses import dataclass, replace
-from typing import List, Set, Optional
+from typing import List, Set, Optional, Tuple
 
 from src.models.build_data import BuildData
 from src.calculator.passive_tree import PassiveTreeGraph, PassiveNode
@@ -363,16 +364,21 @@ def _generate_add_neighbors(
     mutations = []
     class_start = _get_class_start_node(build, tree)
 
+    # One working copy, mutated in place per candidate (add, check, discard)
+    # instead of building a fresh ``passive_nodes | {candidate}`` set each time.
+    allocated = set(build.passive_nodes)
+
     for candidate_node in candidates:
         # Subtask 2.2: Validate tree connectivity
         # New tree = current_nodes ∪ {candidate_node}
-        new_allocated = build.passive_nodes | {candidate_node}
-
         # Fast path: candidate must be connected to at least one allocated node
         # (already guaranteed by candidates generation logic above)
 
         # Verify the entire tree remains connected
-        if not _is_tree_valid_add(build, tree, candidate_node, class_start):
+        allocated.add(candidate_node)
+        connected = tree.is_connected(class_start, candidate_node, allocated)
+        allocated.discard(candidate_node)
+        if not connected:
             continue
 
         # Subtask 2.4: Create TreeMutation with mutation_type="add"
@@ -394,36 +400,6 @@ def _generate_add_neighbors(
     return prioritized
 
 
-def _is_tree_valid_add(
-    build: BuildData,
-    tree: PassiveTreeGraph,
-    new_node: int,
-    class_start: int
-) -> bool:
-    """
-    Fast connectivity check for add mutations.
-
-    For add mutations, we only need to check that the new node
-    is connected to the class start via the existing tree.
-    This is automatically true if the new node is adjacent to
-    any allocated node in a connected tree.
-
-    Args:
-        build: Current BuildData
-        tree: PassiveTreeGraph
-        new_node: Node being added
-        class_start: Class starting node
-
-    Returns:
-        True if adding node maintains connectivity
-    """
-    # New allocated set includes the candidate
-    new_allocated = build.passive_nodes | {new_node}
-
-    # Check if new_node is reachable from class start
-    return tree.is_connected(class_start, new_node, new_allocated)
-
-
 def _generate_swap_neighbors(
     build: BuildData,
     tree: PassiveTreeGraph,
@@ -458,7 +434,7 @@ def _generate_swap_neighbors(
     class_start = _get_class_start_node(build, tree)
 
     # Subtask 3.1: Identify all allocated nodes that can be removed
-    removable_nodes = _find_removable_nodes(build, tree, class_start)
+    removable_nodes = find_removable_nodes(build, tree, class_start)
 
     logger.debug(
         "Swap candidates: %d removable nodes from %d allocated",
@@ -466,27 +442,33 @@ def _generate_swap_neighbors(
         len(build.passive_nodes)
     )
 
+    # Working copy mutated in place (discard/add, check, restore) so each
+    # candidate swap costs O(1) set updates instead of two full set copies.
+    allocated = set(build.passive_nodes)
+
     # Subtask 3.2: For each removable node, find unallocated nodes that become connectable
     for removable_node in removable_nodes:
         # Get potential nodes to add after removal
         # These are unallocated neighbors of the remaining allocated nodes
-        temp_allocated = build.passive_nodes - {removable_node}
+        allocated.discard(removable_node)
 
         # Find all unallocated nodes adjacent to the remaining tree
         add_candidates = set()
-        for allocated_node in temp_allocated:
+        for allocated_node in allocated:
             neighbors = tree.get_neighbors(allocated_node)
             for neighbor in neighbors:
-                if neighbor not in temp_allocated and neighbor != removable_node:
+                if neighbor not in allocated and neighbor != removable_node:
                     add_candidates.add(neighbor)
 
         # For each add candidate, validate the swap
         for add_node in add_candidates:
             # Subtask 3.3: Validate resulting tree connectivity after swap
-            new_allocated = temp_allocated | {add_node}
+            allocated.add(add_node)
 
             # Check if new tree is still connected
-            if not _is_tree_valid_full(tree, new_allocated, class_start):
+            connected = _is_tree_valid_full(tree, allocated, class_start)
+            allocated.discard(add_node)
+            if not connected:
                 continue
 
             # Subtask 3.5: Create TreeMutation with mutation_type="swap"
@@ -499,6 +481,8 @@ def _generate_swap_neighbors(
             )
             mutations.append(mutation)
 
+        allocated.add(removable_node)
+
     logger.debug("Generated %d valid swap mutations", len(mutations))
 
     # Subtask 3.6 & 3.7: Prioritize and limit to top 50-100
@@ -507,7 +491,7 @@ def _generate_swap_neighbors(
     return prioritized
 
 
-def _find_removable_nodes(
+def find_removable_nodes(
     build: BuildData,
     tree: PassiveTreeGraph,
     class_start: int
@@ -518,6 +502,11 @@ def _find_removable_nodes(
     A node is removable if removing it doesn't create orphan nodes
     (all other allocated nodes remain connected to class start).
 
+    Equivalent to checking _is_tree_valid_full() with each node removed, but
+    done in one DFS: when the allocation is connected, a non-start node is
+    removable exactly when it is not an articulation point of the allocated
+    subgraph. O(N + E) instead of one full BFS per allocated node.
+
     Args:
         build: Current BuildData
         tree: PassiveTreeGraph
@@ -526,21 +515,64 @@ def _find_removable_nodes(
     Returns:
         Set of node IDs that can be safely removed
     """
-    removable = set()
+    allocated = build.passive_nodes
 
-    for node in build.passive_nodes:
-        # Never remove the class start node
-        if node == class_start:
-            continue
+    if class_start not in allocated:
+        # Only removing the sole allocated node leaves a (trivially) valid tree
+        return set(allocated) if len(allocated) == 1 else set()
+
+    reached, articulation = _articulation_points(tree, allocated, class_start)
 
-        # Test removal: would remaining nodes stay connected?
-        temp_allocated = build.passive_nodes - {node}
+    if len(reached) != len(allocated):
+        # Already disconnected: only dropping a single orphan can fix it
+        orphans = set(allocated) - reached
+        return orphans if len(orphans) == 1 else set()
 
-        # Check if all remaining nodes are still connected to class start
-        if _is_tree_valid_full(tree, temp_allocated, class_start):
-            removable.add(node)
+    return set(allocated) - articulation - {class_start}
 
-    return removable
+
+def _articulation_points(
+    tree: PassiveTreeGraph,
+    allocated: Set[int],
+    root: int
+) -> Tuple[Set[int], Set[int]]:
+    """
+    Iterative Tarjan DFS over the subgraph induced by the allocated nodes.
+
+    Args:
+        tree: PassiveTreeGraph
+        allocated: Set of allocated node IDs (must contain root)
+        root: DFS root (class start)
+
+    Returns:
+        (reached, articulation): nodes reachable from root, and the non-root
+        nodes among them whose removal disconnects part of that component
+    """
+    disc = {root: 0}
+    low = {root: 0}
+    articulation = set()
+    stack = [(root, None, iter(tree.get_neighbors(root)))]
+
+    while stack:
+        node, parent, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor not in allocated:
+                continue
+            if neighbor not in disc:
+                disc[neighbor] = low[neighbor] = len(disc)
+                stack.append((neighbor, node, iter(tree.get_neighbors(neighbor))))
+                break
+            if neighbor != parent and disc[neighbor] < low[node]:
+                low[node] = disc[neighbor]
+        else:
+            stack.pop()
+            if parent is not None:
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+                if parent != root and low[node] >= disc[parent]:
+                    articulation.add(parent)
+
+    return set(disc), articulation
 
 
 def _is_tree_valid_full(
@@ -568,19 +600,28 @@ def _is_tree_valid_full(
         return False
 
     # Check that all nodes are reachable from class start
-    # We can do this efficiently with a single BFS traversal
+    # We can do this efficiently with a single BFS traversal. Nodes are marked
+    # visited when enqueued (not when popped), so visited and queue stay
+    # disjoint and no node is enqueued twice.
+    # visited only ever holds allocated nodes, so reaching the same size
+    # means every allocated node is connected and the BFS can stop early.
+    target = len(allocated)
     visited = {class_start}
-    queue = [class_start]
+    if target == 1:
+        return True
+    queue = deque([class_start])
 
     while queue:
-        current = queue.pop(0)
+        current = queue.popleft()
         for neighbor in tree.get_neighbors(current):
             if neighbor in allocated and neighbor not in visited:
                 visited.add(neighbor)
+                if len(visited) == target:
+                    return True
                 queue.append(neighbor)
 
-    # All allocated nodes should be visited
-    return visited == allocated
+    # Queue exhausted before reaching every allocated node
+    return False
 
 
 def _get_node_value(node: PassiveNode) -> int:
@@ -465,13 +465,38 @@ def _extract_passive_nodes(pob_root: dict) -> Set[int]:
 
     # Parse comma-separated node IDs
     try:
-        node_ids = set(int(node_id.strip()) for node_id in nodes_str.split(",") if node_id.strip())
-        return node_ids
+        return parse_node_ids(nodes_str)
     except ValueError:
         # If parsing fails, return empty set (non-critical)
         return set()
 
 
+def parse_node_ids(nodes_str: str) -> Set[int]:
+    """Parse a PoB ``Spec @nodes`` CSV string into a set of node IDs.
+
+    The common well-formed case runs as a single ``map(int, ...)`` pass in C
+    (``int()`` already tolerates surrounding whitespace, so no per-token
+    ``strip()``). Only when that fails -- empty tokens from trailing or doubled
+    commas -- does it fall back to the token-filtering slow path.
+
+    Args:
+        nodes_str: Comma-separated node IDs (e.g. ``"12345, 12346,12347"``)
+
+    Returns:
+        Set of node IDs (empty for an empty string)
+
+    Raises:
+        ValueError: If a non-empty token is not an integer
+    """
+    if not nodes_str:
+        return set()
+    tokens = nodes_str.split(",")
+    try:
+        return set(map(int, tokens))
+    except ValueError:
+        return {int(token) for token in tokens if token.strip()}
+
+
 def _extract_items(pob_root: dict) -> List[Item]:
     """Extract equipment items from PoB data.
 
@@ -1,16 +1,26 @@
 """XML parsing utilities for PoB data structures.
 
-Wraps xmltodict for consistent XML handling throughout the parser module.
+Parsing uses the C-accelerated ``xml.etree.ElementTree`` parser and converts
+the resulting tree into the same dict shape ``xmltodict.parse`` produces, so
+callers keep working with ``@attr``/``#text`` keys. Serialization still wraps
+xmltodict for consistent XML output throughout the parser module.
 """
 
+import xml.etree.ElementTree as ET
 import xmltodict
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
 from .exceptions import InvalidFormatError
 
 
 def parse_xml(xml_str: str) -> Dict[str, Any]:
     """Parse XML string into Python dictionary.
 
+    The document is parsed in C by ElementTree and walked once to build the
+    xmltodict-compatible structure: attributes become ``@name`` keys, repeated
+    child tags collapse into lists, text-only elements become plain strings,
+    empty elements become ``None`` and mixed content lands under ``#text``
+    (whitespace-stripped, as xmltodict does).
+
     Args:
         xml_str: XML string to parse
 
@@ -27,9 +37,39 @@ def parse_xml(xml_str: str) -> Dict[str, Any]:
         '90'
     """
     try:
-        return xmltodict.parse(xml_str)
+        root = ET.fromstring(xml_str)
     except Exception as e:
         raise InvalidFormatError(f"Unable to parse XML structure: {e}") from e
+    return {root.tag: element_to_dict(root)}
+
+
+def element_to_dict(elem: ET.Element) -> Union[Dict[str, Any], str, None]:
+    """Convert one element (recursively) into its xmltodict representation.
+
+    Public so streaming readers (``ET.iterparse``) can materialize only the
+    subtrees they need in the same shape ``parse_xml`` returns.
+    """
+    node: Dict[str, Any] = {f"@{key}": value for key, value in elem.attrib.items()}
+    text_parts = [elem.text] if elem.text else []
+
+    for child in elem:
+        value = element_to_dict(child)
+        if child.tag not in node:
+            node[child.tag] = value
+        elif isinstance(node[child.tag], list):
+            node[child.tag].append(value)
+        else:
+            node[child.tag] = [node[child.tag], value]
+        # xmltodict accumulates character data around children into the parent.
+        if child.tail:
+            text_parts.append(child.tail)
+
+    text: Optional[str] = "".join(text_parts).strip() or None
+    if not node:
+        return text
+    if text:
+        node["#text"] = text
+    return node
 
 
 def build_xml(data: Dict[str, Any]) -> str:
@@ -0,0 +1,50 @@
+"""prepare_calc_env / calc_with_env split (no LuaJIT: the engines are faked).
+
+The env must do the BuildData -> Lua conversion once and reuse it for every
+calc_with_env() call, while keeping calculate_build_stats()'s Subprocess
+fallback when MinimalCalc fails.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from src.calculator import build_calculator
+from src.calculator.build_calculator import calc_with_env, prepare_calc_env
+from src.calculator.exceptions import CalculationError
+from src.models.build_data import BuildData, CharacterClass
+from src.models.build_stats import BuildStats
+
+
+def _build():
+    return BuildData(character_class=CharacterClass.WITCH, level=90, passive_nodes={1, 2})
+
+
+def _stats(dps):
+    return BuildStats(total_dps=dps, effective_hp=100.0, life=100, energy_shield=0,
+                      mana=50, resistances={"fire": 0, "cold": 0, "lightning": 0, "chaos": 0})
+
+
+def test_env_prepares_once_and_reuses_lua_table():
+    engine, sub = MagicMock(), MagicMock()
+    engine.calculate_prepared.return_value = _stats(1.0)
+    with patch.object(build_calculator, "get_pob_engine", return_value=engine), \
+            patch.object(build_calculator, "get_subprocess_calculator", return_value=sub):
+        env = prepare_calc_env(_build())
+        for _ in range(3):
+            assert calc_with_env(env).total_dps == 1.0
+
+    engine.prepare.assert_called_once()
+    assert engine.calculate_prepared.call_count == 3
+    engine.calculate_prepared.assert_called_with(engine.prepare.return_value)
+    sub.calculate.assert_not_called()
+
+
+def test_env_falls_back_to_subprocess_on_minimalcalc_error():
+    engine, sub = MagicMock(), MagicMock()
+    engine.calculate_prepared.side_effect = CalculationError("lua boom")
+    sub.calculate.return_value = _stats(7.0)
+    with patch.object(build_calculator, "get_pob_engine", return_value=engine), \
+            patch.object(build_calculator, "get_subprocess_calculator", return_value=sub):
+        build = _build()
+        assert calc_with_env(prepare_calc_env(build)).total_dps == 7.0
+
+    sub.calculate.assert_called_once_with(build)
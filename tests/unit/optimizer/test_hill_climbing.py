@@ -277,6 +277,39 @@ class TestNeighborEvaluation:
         assert len(evaluations) == 2
 
 
+    @patch('optimizer.hill_climbing.calculate_build_stats')
+    def test_evaluate_neighbors_reuses_cached_stats(
+        self,
+        mock_calculate,
+        sample_stats
+    ):
+        """
+        Verify _evaluate_neighbors() skips the calculation for node sets
+        already present in stats_cache and stores new results in it
+        """
+        # Arrange - neighbor {1,2,3,4} was evaluated in an earlier sweep
+        neighbors = [
+            BuildData(
+                character_class=CharacterClass.WITCH,
+                level=50,
+                passive_nodes={1, 2, 3, i}
+            )
+            for i in range(4, 6)
+        ]
+        stats_cache = {frozenset({1, 2, 3, 4}): sample_stats}
+        mock_calculate.return_value = sample_stats
+
+        # Act
+        evaluations = _evaluate_neighbors(
+            neighbors, "dps", sample_stats, stats_cache=stats_cache
+        )
+
+        # Assert - only the uncached neighbor hit the calculator
+        assert mock_calculate.call_count == 1
+        assert len(evaluations) == 2
+        assert frozenset({1, 2, 3, 5}) in stats_cache
+
+
 class TestBestNeighborSelection:
     """Test suite for AC-2.1.4: Algorithm selects best neighbor"""
 
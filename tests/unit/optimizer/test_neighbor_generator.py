@@ -31,9 +31,8 @@ from optimizer.neighbor_generator import (
     _prioritize_mutations,
     _get_class_start_node,
     _is_tree_valid,
-    _is_tree_valid_add,
     _is_tree_valid_full,
-    _find_removable_nodes
+    find_removable_nodes
 )
 from models.build_data import BuildData, CharacterClass
 from calculator.passive_tree import PassiveNode, PassiveTreeGraph
@@ -375,15 +374,37 @@ class TestSwapNeighborGeneration:
 
         assert mutations == []
 
+    def test_swap_neighbors_leave_build_nodes_unchanged(self, sample_build, simple_tree, budget_with_respec):
+        """In-place add/discard on the working set must not leak into the build"""
+        before = set(sample_build.passive_nodes)
+
+        _generate_swap_neighbors(sample_build, simple_tree, budget_with_respec)
+        find_removable_nodes(sample_build, simple_tree, class_start=1)
+
+        assert sample_build.passive_nodes == before
+
     def test_find_removable_nodes(self, sample_build, simple_tree):
         """Test identifying removable nodes (Subtask 3.1)"""
-        removable = _find_removable_nodes(sample_build, simple_tree, class_start=1)
+        removable = find_removable_nodes(sample_build, simple_tree, class_start=1)
 
         # Node 2 can be removed (would leave just node 1)
         # Node 1 cannot be removed (class start)
         assert 1 not in removable
         assert 2 in removable
 
+    def test_find_removable_nodes_skips_articulation_points(self, simple_tree):
+        """Interior nodes holding branches together are not removable; leaves are"""
+        build = BuildData(
+            character_class=CharacterClass.WITCH,
+            level=50,
+            passive_nodes={1, 2, 3, 4, 5}
+        )
+
+        removable = find_removable_nodes(build, simple_tree, class_start=1)
+
+        # 2 joins the start to both branches, 4 joins 5; only leaves 3 and 5 go
+        assert removable == {3, 5}
+
     def test_swap_maintains_connectivity(self, simple_tree, budget_with_respec):
         """Test that swap neighbors maintain tree connectivity (AC-2.2.3)"""
         # Build with nodes 1, 2, 3
@@ -577,11 +598,6 @@ class TestConnectivityValidation:
         allocated = {1, 5}
         assert _is_tree_valid_full(simple_tree, allocated, class_start=1) is False
 
-    def test_is_tree_valid_add_valid(self, sample_build, simple_tree):
-        """Test add validation with valid candidate"""
-        # Adding node 3 is valid (connected via node 2)
-        assert _is_tree_valid_add(sample_build, simple_tree, new_node=3, class_start=1) is True
-
     def test_get_class_start_node(self, sample_build, simple_tree):
         """Test getting class start node"""
         start_node = _get_class_start_node(sample_build, simple_tree)
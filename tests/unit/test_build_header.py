@@ -0,0 +1,56 @@
+"""Unit tests for scripts/_build_header.py.
+
+Hermetic: XML files live under tmp_path.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# scripts/ is not a package — import via path insertion (story 3.5.3 dev notes).
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from _build_header import parse_build_header, read_build_header  # noqa: E402
+
+
+def test_reads_build_and_spec_attributes(tmp_path):
+    xml = tmp_path / "build.xml"
+    xml.write_text(
+        '<PathOfBuilding2>'
+        '<Build level="90" className="Witch"><PlayerStat stat="Life" value="1"/></Build>'
+        '<Tree activeSpec="1"><Spec nodes="1,2,3"><Sockets/></Spec></Tree>'
+        '<Items><Item>unclosed'  # never reached: reading stops after </Tree>
+        , encoding="utf-8"
+    )
+
+    build, spec = read_build_header(xml)
+
+    assert build == {"level": "90", "className": "Witch"}
+    assert spec == {"nodes": "1,2,3"}
+
+
+def test_multiple_specs_yield_none(tmp_path):
+    xml = tmp_path / "build.xml"
+    xml.write_text(
+        '<PathOfBuilding><Build level="1"/>'
+        '<Tree><Spec nodes="1"/><Spec nodes="2"/></Tree></PathOfBuilding>',
+        encoding="utf-8"
+    )
+
+    assert read_build_header(xml) == ({"level": "1"}, None)
+
+
+def test_rejects_non_pob_root(tmp_path):
+    xml = tmp_path / "build.xml"
+    xml.write_text('<Other><Build level="1"/></Other>', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        read_build_header(xml)
+
+
+def test_parses_in_memory_document():
+    xml = '<PathOfBuilding2><Build level="5"/><Tree><Spec nodes="4"/></Tree></PathOfBuilding2>'
+
+    assert parse_build_header(xml) == ({"level": "5"}, {"nodes": "4"})
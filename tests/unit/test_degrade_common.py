@@ -0,0 +1,32 @@
+"""Unit tests for scripts/_degrade_common.py."""
+
+import sys
+from pathlib import Path
+
+# scripts/ is not a package — import via path insertion (story 3.5.3 dev notes).
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from _degrade_common import set_spec_nodes  # noqa: E402
+
+
+def test_rewrites_nodes_and_keeps_formatting():
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<PathOfBuilding2>\n\t<Build level="90"/>\n'
+        '\t<Tree activeSpec="1">\n\t\t<Spec treeVersion="0_1" nodes="1,2,3" classId="1">\n'
+        '\t\t\t<Sockets/>\n\t\t</Spec>\n\t</Tree>\n</PathOfBuilding2>'
+    )
+
+    result = set_spec_nodes(xml, "1,2")
+
+    assert result == xml.replace('nodes="1,2,3"', 'nodes="1,2"')
+
+
+def test_adds_nodes_attribute_and_declaration_via_fallback():
+    xml = '<PathOfBuilding2><Tree><Spec classId="1"/></Tree></PathOfBuilding2>'
+
+    result = set_spec_nodes(xml, "7,8")
+
+    assert result.startswith('<?xml version="1.0" encoding="UTF-8"?>\n')
+    assert 'nodes="7,8"' in result
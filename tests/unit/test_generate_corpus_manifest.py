@@ -0,0 +1,46 @@
+"""Unit tests for scripts/generate_corpus_manifest.py metadata extraction.
+
+Hermetic: XML files live under tmp_path.
+"""
+
+import sys
+from pathlib import Path
+
+# scripts/ is not a package — import via path insertion (story 3.5.3 dev notes).
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from generate_corpus_manifest import extract_build_metadata  # noqa: E402
+
+
+def _write_build(tmp_path, tree):
+    xml = tmp_path / "build.xml"
+    xml.write_text(
+        '<PathOfBuilding2>'
+        '<Build level="10" className="Witch" ascendClassName="Infernalist"/>'
+        f'{tree}'
+        '</PathOfBuilding2>',
+        encoding="utf-8"
+    )
+    return xml
+
+
+def test_counts_allocated_points_of_single_spec(tmp_path):
+    xml = _write_build(tmp_path, '<Tree activeSpec="1"><Spec nodes="1,2,3,"/></Tree>')
+
+    metadata = extract_build_metadata(xml)
+
+    assert metadata["character_class"] == "Witch"
+    assert metadata["allocated_points"] == 3
+    assert metadata["unallocated_points"] == 6
+    assert metadata["total_points_available"] == 9
+
+
+def test_multi_spec_build_is_reported_as_unparsed(tmp_path, capsys):
+    xml = _write_build(
+        tmp_path,
+        '<Tree activeSpec="2"><Spec nodes="1,2"/><Spec nodes="1,2,3"/></Tree>'
+    )
+
+    assert extract_build_metadata(xml) is None
+    assert "Error parsing build.xml" in capsys.readouterr().out
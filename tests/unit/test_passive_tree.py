@@ -13,6 +13,7 @@ Author: Dev Agent (Amelia)
 Date: 2025-10-20
 """
 
+import json
 import os
 import pytest
 from pathlib import Path
@@ -28,6 +29,7 @@ from calculator.passive_tree import (
     load_passive_tree,
     get_passive_tree,
     clear_passive_tree_cache,
+    _load_tree_file,
 )
 
 
@@ -348,6 +350,54 @@ class TestCaching:
         # But should have same content
         assert tree1.get_node_count() == tree2.get_node_count()
 
+    def test_disk_cache_reused_until_tree_file_changes(self, tmp_path):
+        """Built graph is pickled and reused; editing tree.json invalidates it"""
+        tree_file = tmp_path / "tree.json"
+        cache_dir = tmp_path / "cache"
+        tree_file.write_text(json.dumps({
+            "groups": [],
+            "nodes": {"1": {"name": "A", "connections": [{"id": 2}]}, "2": {"name": "B"}},
+        }), encoding="utf-8")
+
+        tree1 = _load_tree_file(tree_file, "test", cache_dir)
+        tree2 = _load_tree_file(tree_file, "test", cache_dir)
+
+        assert (cache_dir / "test.pkl").exists()
+        assert tree2 is not tree1 and tree2 == tree1
+        assert tree2.get_neighbors(2) == {1}
+
+        tree_file.write_text(json.dumps({
+            "groups": [],
+            "nodes": {"1": {"name": "A"}},
+        }), encoding="utf-8")
+        os.utime(tree_file, ns=(0, 0))
+
+        assert _load_tree_file(tree_file, "test", cache_dir).get_node_count() == 1
+
+    def test_disk_cache_shared_across_import_paths(self, tmp_path, monkeypatch):
+        """Cache written via calculator.passive_tree loads via src.calculator.passive_tree"""
+        import src.calculator.passive_tree as src_passive_tree
+
+        tree_file = tmp_path / "tree.json"
+        cache_dir = tmp_path / "cache"
+        tree_file.write_text(json.dumps({
+            "groups": [],
+            "nodes": {"1": {"name": "A", "isNotable": True, "connections": [{"id": 2}]}, "2": {"name": "B"}},
+        }), encoding="utf-8")
+
+        written = _load_tree_file(tree_file, "test", cache_dir)
+
+        def no_rebuild(*args):
+            raise AssertionError("cache miss: tree was rebuilt")
+
+        monkeypatch.setattr(src_passive_tree, "_build_passive_tree", no_rebuild)
+        loaded = src_passive_tree._load_tree_file(tree_file, "test", cache_dir)
+
+        assert isinstance(loaded, src_passive_tree.PassiveTreeGraph)
+        assert loaded.nodes[1].is_notable and loaded.nodes[1].name == "A"
+        assert loaded.edges == written.edges
+        assert loaded.class_start_nodes == written.class_start_nodes
+
 
 class TestLuaTableConversion:
     """Test suite for to_lua_table() conversion (Story 1.5 integration)"""
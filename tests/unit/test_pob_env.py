@@ -385,7 +385,7 @@ class TestCorpusEntryGuard:
         )
         monkeypatch.setattr(mod, "verify", lambda root: bad)
 
-        assert mod.main() == 2
+        assert mod.main([]) == 2
         out = capsys.readouterr().out
         assert "PoB environment verification failed" in out
         assert "setup_pob.py" in out
@@ -13,7 +13,7 @@ import base64
 import zlib
 import pytest
 
-from src.parsers.pob_parser import parse_pob_code
+from src.parsers.pob_parser import parse_pob_code, parse_node_ids
 from src.parsers.exceptions import PoBParseError, InvalidFormatError, UnsupportedVersionError
 from src.models.build_data import BuildData, CharacterClass
 
@@ -278,3 +278,16 @@ def test_empty_passive_nodes():
 
     assert len(build.passive_nodes) == 0
     assert build.allocated_point_count == 0
+
+
+def test_parse_node_ids_tolerates_empty_tokens():
+    """Trailing/doubled commas fall back to the filtering path."""
+    assert parse_node_ids("1,2,3") == {1, 2, 3}
+    assert parse_node_ids(" 1 ,2,,3,") == {1, 2, 3}
+    assert parse_node_ids("") == set()
+
+
+def test_parse_node_ids_rejects_non_integer_tokens():
+    """Garbage tokens still raise so callers keep their fallback behavior."""
+    with pytest.raises(ValueError):
+        parse_node_ids("1,abc,3")
@@ -0,0 +1,33 @@
+"""Unit tests for scripts/run_epic2_validation_isolated.py worker handling.
+
+Hermetic: the worker is a tiny stand-in script under tmp_path, not the
+optimizer.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# scripts/ is not a package — import via path insertion (story 3.5.3 dev notes).
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from run_epic2_validation_isolated import PersistentWorker  # noqa: E402
+
+
+def test_persistent_worker_timeout_raises_timeout_expired(tmp_path):
+    # Accepts the job but never writes a result; exits once stdin closes.
+    worker_file = tmp_path / "worker.py"
+    worker_file.write_text("import sys\nsys.stdin.read()\n", encoding="utf-8")
+    worker = PersistentWorker(worker_file)
+
+    try:
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+            worker.run(tmp_path / "build.xml", tmp_path / "result.json", timeout=0.3)
+    finally:
+        worker.stop()
+
+    assert str(worker_file) in exc_info.value.cmd
+    assert worker.proc is None
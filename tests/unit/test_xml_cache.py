@@ -0,0 +1,60 @@
+"""Unit tests for scripts/_xml_cache.py.
+
+Hermetic: XML files and the cache directory both live under tmp_path.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# scripts/ is not a package — import via path insertion (story 3.5.3 dev notes).
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import _xml_cache  # noqa: E402
+
+
+def _write(path: Path, level: str) -> None:
+    path.write_text(f'<PathOfBuilding2><Build level="{level}"/></PathOfBuilding2>', encoding="utf-8")
+
+
+def test_second_read_is_served_from_cache(tmp_path, monkeypatch):
+    xml = tmp_path / "build.xml"
+    _write(xml, "90")
+    cache_dir = tmp_path / "cache"
+
+    first = _xml_cache.parse_xml_file(xml, cache_dir=cache_dir)
+    assert first["PathOfBuilding2"]["Build"]["@level"] == "90"
+
+    def fail(_xml_str):
+        raise AssertionError("parse_xml called despite a fresh cache entry")
+
+    monkeypatch.setattr(_xml_cache, "parse_xml", fail)
+    assert _xml_cache.parse_xml_file(xml, cache_dir=cache_dir) == first
+
+
+def test_edited_file_is_reparsed(tmp_path):
+    xml = tmp_path / "build.xml"
+    _write(xml, "90")
+    cache_dir = tmp_path / "cache"
+    _xml_cache.parse_xml_file(xml, cache_dir=cache_dir)
+
+    _write(xml, "100")
+    st = xml.stat()
+    os.utime(xml, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    data = _xml_cache.parse_xml_file(xml, cache_dir=cache_dir)
+    assert data["PathOfBuilding2"]["Build"]["@level"] == "100"
+
+
+def test_corrupt_cache_entry_is_rebuilt(tmp_path):
+    xml = tmp_path / "build.xml"
+    _write(xml, "90")
+    cache_dir = tmp_path / "cache"
+    _xml_cache.parse_xml_file(xml, cache_dir=cache_dir)
+
+    for entry in cache_dir.iterdir():
+        entry.write_bytes(b"not a pickle")
+
+    data = _xml_cache.parse_xml_file(xml, cache_dir=cache_dir)
+    assert data["PathOfBuilding2"]["Build"]["@level"] == "90"
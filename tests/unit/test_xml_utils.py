@@ -0,0 +1,46 @@
+"""Unit tests for the ElementTree-backed parse_xml.
+
+parse_xml must keep emitting the exact dict shape xmltodict produced, since
+every extractor in pob_parser indexes into it by ``@attr``/``#text`` keys.
+"""
+
+import pytest
+
+from src.parsers.xml_utils import parse_xml
+from src.parsers.exceptions import InvalidFormatError
+
+
+def test_attributes_become_at_keys():
+    data = parse_xml('<PathOfBuilding2><Build level="90" className="Witch"/></PathOfBuilding2>')
+    assert data == {"PathOfBuilding2": {"Build": {"@level": "90", "@className": "Witch"}}}
+
+
+def test_repeated_children_collapse_into_list():
+    data = parse_xml(
+        '<ConfigSet id="1"><Input name="a" number="1"/><Input name="b" boolean="true"/>'
+        '<Placeholder name="c" number="2"/></ConfigSet>'
+    )
+    config_set = data["ConfigSet"]
+    assert config_set["Input"] == [
+        {"@name": "a", "@number": "1"},
+        {"@name": "b", "@boolean": "true"},
+    ]
+    assert config_set["Placeholder"] == {"@name": "c", "@number": "2"}
+
+
+def test_text_only_empty_and_mixed_content():
+    data = parse_xml('<Root><Notes>  hello  </Notes><Items/><Item id="1">Rarity: RARE<ModRange id="1"/> tail</Item></Root>')
+    root = data["Root"]
+    assert root["Notes"] == "hello"
+    assert root["Items"] is None
+    assert root["Item"] == {"@id": "1", "ModRange": {"@id": "1"}, "#text": "Rarity: RARE tail"}
+
+
+def test_xml_declaration_is_accepted():
+    data = parse_xml('<?xml version="1.0" encoding="UTF-8"?>\n<PathOfBuilding><Tree/></PathOfBuilding>')
+    assert data == {"PathOfBuilding": {"Tree": None}}
+
+
+def test_malformed_xml_raises_invalid_format():
+    with pytest.raises(InvalidFormatError):
+        parse_xml("<PathOfBuilding><Build></PathOfBuilding>")